@@ -0,0 +1,58 @@
+"""
+Array Utilities
+Shared NumPy/pandas helpers used by the analysis engines.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def top_n_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Positions of the n largest values, largest first.
+
+    O(N) selection with np.partition instead of a full sort; NaN values are
+    skipped and ties keep their original order, as with DataFrame.nlargest.
+
+    Args:
+        values: Scores to rank (any sequence convertible to float)
+        n: Number of positions to return
+
+    Returns:
+        Integer positions into values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    candidates = np.flatnonzero(~np.isnan(values))
+    n = min(n, len(candidates))
+    if n <= 0:
+        return candidates[:0]
+
+    candidate_values = values[candidates]
+    cutoff = -np.partition(-candidate_values, n - 1)[n - 1]
+    above = candidates[candidate_values > cutoff]
+    ties = candidates[candidate_values == cutoff][:n - len(above)]
+    top = np.concatenate((above, ties))
+    return top[np.lexsort((top, -values[top]))]
+
+
+def _copy_on_write_enabled() -> bool:
+    """True when pandas copies shared column data before any in-place edit"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def frame_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of a DataFrame that later in-place edits by the caller cannot change.
+
+    With Copy-on-Write (always on from pandas 3) a shallow copy is enough and
+    shares the column buffers; older pandas without it gets a deep copy.
+
+    Args:
+        df: DataFrame to snapshot
+
+    Returns:
+        Independent view of the data as it is now
+    """
+    return df.copy(deep=not _copy_on_write_enabled())
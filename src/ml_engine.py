@@ -8,7 +8,8 @@ import pandas as pd
 from typing import Dict, List, Any, Tuple, Optional
 import logging
 from pathlib import Path
-import pickle
+import joblib
+import weakref
 
 from sklearn.cluster import KMeans
 from sklearn.ensemble import IsolationForest, RandomForestClassifier
@@ -16,10 +17,20 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 import warnings
 
+from .array_utils import top_n_positions
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
 
+def _snapshot_order(snapshot: Dict[str, Any]) -> Tuple[bool, Any]:
+    """Sort key for history snapshots: by timestamp, missing timestamps last"""
+    timestamp = snapshot.get('assessment_timestamp')
+    if timestamp is None or pd.isna(timestamp):
+        return (True, None)
+    return (False, timestamp)
+
+
 class MLEngine:
     """
     Machine Learning engine for application portfolio analysis.
@@ -31,6 +42,31 @@ class MLEngine:
     - ML-enhanced recommendations
     """
 
+    # Attribute name -> file name for persisted models
+    MODEL_FILES = {
+        'clustering_model': 'clustering_model.joblib',
+        'anomaly_detector': 'anomaly_detector.joblib',
+        'scaler': 'scaler.joblib'
+    }
+
+    # Pickle files written by earlier versions, loaded when no .joblib file exists
+    LEGACY_MODEL_FILES = {
+        'clustering_model': 'clustering_model.pkl',
+        'anomaly_detector': 'anomaly_detector.pkl',
+        'scaler': 'scaler.pkl'
+    }
+
+    # Feature, reason if above 95th percentile, reason if below 5th percentile
+    ANOMALY_REASONS = [
+        ('Business Value', 'Exceptionally high business value', 'Unusually low business value'),
+        ('Tech Health', 'Exceptional technical health', 'Very poor technical health'),
+        ('Cost', 'Extremely high cost', 'Unusually low cost'),
+        ('Usage', 'Very high usage', 'Minimal usage')
+    ]
+
+    # Maximum number of scaled feature matrices kept
+    FEATURE_CACHE_SIZE = 4
+
     def __init__(self, model_path: str = None):
         """
         Initialize ML engine.
@@ -45,11 +81,20 @@ class MLEngine:
         self.model_path.mkdir(parents=True, exist_ok=True)
 
         # Initialize models
-        self.scaler = StandardScaler()
+        self.scaler = StandardScaler(copy=False)
         self.clustering_model = None
         self.anomaly_detector = None
         self.trend_predictor = None
 
+        # Modification times of the model files as of the last save/load
+        self._model_mtimes: Dict[str, float] = {}
+
+        # Scaled feature matrices in the current scaler space, keyed by id()
+        # of the frame they were built from; the weak reference confirms the
+        # id still belongs to that frame without keeping it alive
+        self._feature_cache: Dict[int, Tuple[weakref.ref, np.ndarray]] = {}
+        self._scaler_fit_key: Optional[int] = None
+
         # Feature columns for ML
         self.feature_columns = [
             'Business Value',
@@ -61,12 +106,24 @@ class MLEngine:
             'Redundancy'
         ]
 
-    def prepare_features(self, df: pd.DataFrame) -> Tuple[np.ndarray, pd.DataFrame]:
+    def prepare_features(
+        self,
+        df: pd.DataFrame,
+        refit: bool = True
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
         """
         Prepare features for ML models.
 
         Args:
             df: Input DataFrame
+            refit: Refit the scaler on df. When False, the already fitted
+                scaler is reused so features stay in the space the existing
+                models were trained in.
+
+        The scaled matrix is cached per DataFrame object, so clustering,
+        anomaly detection and recommendations on the same frame only build it
+        once. Call clear_feature_cache() after editing df in place, or to
+        release the cached matrices.
 
         Returns:
             Tuple of (scaled_features, original_df)
@@ -77,25 +134,52 @@ class MLEngine:
                 logger.warning(f"Missing column {col}, filling with 0")
                 df[col] = 0
 
-        # Extract features
-        X = df[self.feature_columns].copy()
+        key = id(df)
+        cached = self._feature_cache.get(key)
+        if (cached is not None and cached[0]() is df and len(cached[1]) == len(df)
+                and (not refit or key == self._scaler_fit_key)):
+            return cached[1], df
+
+        # Extract features as one float32 buffer (half the memory traffic of float64)
+        X = df[self.feature_columns].to_numpy(dtype=np.float32, copy=True)
 
         # Handle missing values
-        X = X.fillna(X.mean())
+        missing = np.isnan(X)
+        if missing.any():
+            X[missing] = np.take(np.nanmean(X, axis=0), np.nonzero(missing)[1])
 
         # Normalize cost (log scale)
-        if 'Cost' in X.columns:
-            X['Cost'] = np.log1p(X['Cost'])
+        cost_idx = self.feature_columns.index('Cost')
+        X[:, cost_idx] = np.log1p(X[:, cost_idx])
+
+        # Scale features (StandardScaler keeps float32 and scales in place)
+        if refit or not hasattr(self.scaler, 'mean_'):
+            X_scaled = self.scaler.fit_transform(X)
+            # Matrices scaled by the previous fit are no longer comparable
+            self._feature_cache.clear()
+            self._scaler_fit_key = key
+            self._mark_models_modified()
+        else:
+            X_scaled = self.scaler.transform(X)
+        X_scaled = X_scaled.astype(np.float32, copy=False)
 
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        self._feature_cache.pop(key, None)
+        if len(self._feature_cache) >= self.FEATURE_CACHE_SIZE:
+            del self._feature_cache[next(iter(self._feature_cache))]
+        self._feature_cache[key] = (weakref.ref(df), X_scaled)
 
         return X_scaled, df
 
+    def clear_feature_cache(self):
+        """Release cached feature matrices"""
+        self._feature_cache.clear()
+        self._scaler_fit_key = None
+
     def cluster_applications(
         self,
         df: pd.DataFrame,
-        n_clusters: int = 5
+        n_clusters: int = 5,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """
         Cluster applications into similar groups using KMeans.
@@ -103,6 +187,8 @@ class MLEngine:
         Args:
             df: Application data
             n_clusters: Number of clusters to create
+            columnar: Return clustered_data as {column: values} instead of
+                one dict per application (far fewer Python objects)
 
         Returns:
             Dictionary with clustering results
@@ -118,47 +204,73 @@ class MLEngine:
             random_state=42,
             n_init=10
         )
+        self._mark_models_modified()
 
         cluster_labels = self.clustering_model.fit_predict(X_scaled)
 
-        # Add cluster labels to dataframe
-        df_clustered = df_original.copy()
-        df_clustered['Cluster'] = cluster_labels
+        # Add cluster labels to dataframe (assign makes the only copy)
+        df_clustered = df_original.assign(Cluster=cluster_labels)
+
+        # Analyze clusters: aggregate every cluster in one groupby pass
+        grouped = df_clustered.groupby('Cluster', sort=True)
+        agg = grouped.agg(
+            size=('Cluster', 'size'),
+            avg_business_value=('Business Value', 'mean'),
+            avg_tech_health=('Tech Health', 'mean'),
+            avg_cost=('Cost', 'mean'),
+            median_cost=('Cost', 'median'),
+        ).reindex(range(n_clusters))
+        agg['size'] = agg['size'].fillna(0).astype(int)
+
+        if 'Composite Score' in df_clustered.columns:
+            avg_composite = grouped['Composite Score'].mean().reindex(agg.index)
+        else:
+            avg_composite = None
+        if 'Action Recommendation' in df_clustered.columns:
+            dominant = grouped['Action Recommendation'].agg(lambda s: s.mode()[0]).reindex(agg.index)
+        else:
+            dominant = None
+        top_apps = grouped['Application Name'].agg(lambda s: s.tolist()[:10]).reindex(agg.index)
+
+        # Generate cluster labels; np.select keeps the first matching rule
+        value = agg['avg_business_value'].to_numpy()
+        health = agg['avg_tech_health'].to_numpy()
+        conditions = [
+            (value > 7) & (health > 7),
+            (value > 7) & (health < 5),
+            (value < 5) & (health > 7),
+            agg['avg_cost'].to_numpy() > agg['median_cost'].to_numpy() * 2,
+        ]
+        labels = np.select(
+            conditions,
+            ['Strategic Leaders', 'Technical Debt', 'Solid but Underutilized', 'High Cost Burden'],
+            default=np.array([f'Group {i+1}' for i in agg.index], dtype=object)
+        )
+        descriptions = np.select(
+            conditions,
+            [
+                'High-performing strategic applications',
+                'High value but needs modernization',
+                'Good tech, limited business impact',
+                'Expensive applications requiring review',
+            ],
+            default='Standard application group'
+        )
 
-        # Analyze clusters
         clusters_analysis = []
-        for i in range(n_clusters):
-            cluster_apps = df_clustered[df_clustered['Cluster'] == i]
-
-            cluster_info = {
+        for i in agg.index:
+            clusters_analysis.append({
                 'cluster_id': int(i),
-                'size': len(cluster_apps),
-                'avg_business_value': float(cluster_apps['Business Value'].mean()),
-                'avg_tech_health': float(cluster_apps['Tech Health'].mean()),
-                'avg_cost': float(cluster_apps['Cost'].mean()),
-                'avg_composite_score': float(cluster_apps['Composite Score'].mean()) if 'Composite Score' in cluster_apps.columns else None,
-                'dominant_recommendation': cluster_apps['Action Recommendation'].mode()[0] if 'Action Recommendation' in cluster_apps.columns else None,
-                'applications': cluster_apps['Application Name'].tolist()[:10]  # Top 10 apps
-            }
-
-            # Generate cluster label
-            if cluster_info['avg_business_value'] > 7 and cluster_info['avg_tech_health'] > 7:
-                cluster_info['label'] = 'Strategic Leaders'
-                cluster_info['description'] = 'High-performing strategic applications'
-            elif cluster_info['avg_business_value'] > 7 and cluster_info['avg_tech_health'] < 5:
-                cluster_info['label'] = 'Technical Debt'
-                cluster_info['description'] = 'High value but needs modernization'
-            elif cluster_info['avg_business_value'] < 5 and cluster_info['avg_tech_health'] > 7:
-                cluster_info['label'] = 'Solid but Underutilized'
-                cluster_info['description'] = 'Good tech, limited business impact'
-            elif cluster_info['avg_cost'] > cluster_apps['Cost'].median() * 2:
-                cluster_info['label'] = 'High Cost Burden'
-                cluster_info['description'] = 'Expensive applications requiring review'
-            else:
-                cluster_info['label'] = f'Group {i+1}'
-                cluster_info['description'] = 'Standard application group'
-
-            clusters_analysis.append(cluster_info)
+                'size': int(agg.at[i, 'size']),
+                'avg_business_value': float(agg.at[i, 'avg_business_value']),
+                'avg_tech_health': float(agg.at[i, 'avg_tech_health']),
+                'avg_cost': float(agg.at[i, 'avg_cost']),
+                'avg_composite_score': float(avg_composite[i]) if avg_composite is not None else None,
+                'dominant_recommendation': dominant[i] if dominant is not None else None,
+                'applications': top_apps[i] if isinstance(top_apps[i], list) else [],  # Top 10 apps
+                'label': str(labels[i]),
+                'description': str(descriptions[i]),
+            })
 
         # Sort by cluster size
         clusters_analysis.sort(key=lambda x: x['size'], reverse=True)
@@ -166,7 +278,7 @@ class MLEngine:
         return {
             'n_clusters': n_clusters,
             'clusters': clusters_analysis,
-            'clustered_data': df_clustered.to_dict('records')
+            'clustered_data': df_clustered.to_dict('list' if columnar else 'records')
         }
 
     def detect_anomalies(
@@ -189,61 +301,85 @@ class MLEngine:
         # Prepare features
         X_scaled, df_original = self.prepare_features(df)
 
-        # Train Isolation Forest
+        # Train Isolation Forest, sized to the portfolio: small portfolios
+        # need fewer trees, and 256 samples per tree is the paper's default
+        n_samples = len(X_scaled)
         self.anomaly_detector = IsolationForest(
             contamination=contamination,
             random_state=42,
-            n_estimators=100
+            n_estimators=min(100, max(25, n_samples // 50)),
+            max_samples=min(256, n_samples),
+            bootstrap=False,
+            n_jobs=-1
         )
+        self._mark_models_modified()
 
-        predictions = self.anomaly_detector.fit_predict(X_scaled)
+        # Score once and threshold against offset_ (what predict() does internally)
+        self.anomaly_detector.fit(X_scaled)
         anomaly_scores = self.anomaly_detector.score_samples(X_scaled)
+        predictions = np.where(anomaly_scores < self.anomaly_detector.offset_, -1, 1)
 
-        # Add anomaly info to dataframe
-        df_anomalies = df_original.copy()
-        df_anomalies['Is_Anomaly'] = (predictions == -1)
-        df_anomalies['Anomaly_Score'] = anomaly_scores
+        # Get anomalous applications, copying only those rows and the reported columns
+        reason_columns = [column for column, _, _ in self.ANOMALY_REASONS]
+        columns = ['Application Name'] + reason_columns + [
+            column for column in ('Composite Score', 'Action Recommendation')
+            if column in df_original.columns
+        ]
+        is_anomaly = predictions == -1
+        order = np.argsort(anomaly_scores[is_anomaly])
+        anomalies = df_original.loc[is_anomaly, columns].iloc[order]
+
+        # Population thresholds per reason feature: (K, 2) of 5th/95th percentiles
+        thresholds = np.nanquantile(
+            df_original[reason_columns].to_numpy(dtype=np.float64), [0.05, 0.95], axis=0
+        ).T
+        high_reasons = np.array([high for _, high, _ in self.ANOMALY_REASONS])
+        low_reasons = np.array([low for _, _, low in self.ANOMALY_REASONS])
+
+        # Check each feature of every anomaly against the population at once
+        values = anomalies[reason_columns].to_numpy(dtype=np.float64)
+        reason_matrix = np.where(
+            values > thresholds[None, :, 1], high_reasons,
+            np.where(values < thresholds[None, :, 0], low_reasons, '')
+        )
 
-        # Get anomalous applications
-        anomalies = df_anomalies[df_anomalies['Is_Anomaly']].copy()
-        anomalies = anomalies.sort_values('Anomaly_Score')
+        # Severity: the lowest third of anomaly scores is High
+        scores = anomaly_scores[is_anomaly][order]
+        if len(scores):
+            severities = np.where(scores < np.quantile(scores, 0.33), 'High', 'Medium')
+        else:
+            severities = np.array([], dtype=str)
+
+        # Pull the reported columns once; the loop below only indexes arrays
+        n_anomalies = len(anomalies)
+        names = anomalies['Application Name'].to_numpy()
+        business_values = anomalies['Business Value'].to_numpy(dtype=np.float64)
+        tech_healths = anomalies['Tech Health'].to_numpy(dtype=np.float64)
+        costs = anomalies['Cost'].to_numpy(dtype=np.float64)
+        if 'Composite Score' in anomalies.columns:
+            composite_scores = anomalies['Composite Score'].to_numpy(dtype=np.float64)
+        else:
+            composite_scores = np.zeros(n_anomalies)
+        if 'Action Recommendation' in anomalies.columns:
+            actions = anomalies['Action Recommendation'].to_numpy()
+        else:
+            actions = np.full(n_anomalies, 'N/A', dtype=object)
 
         # Analyze why each app is anomalous
         anomaly_list = []
-        for _, app in anomalies.iterrows():
-            reasons = []
-
-            # Check each feature against population
-            if app['Business Value'] > df_original['Business Value'].quantile(0.95):
-                reasons.append('Exceptionally high business value')
-            elif app['Business Value'] < df_original['Business Value'].quantile(0.05):
-                reasons.append('Unusually low business value')
-
-            if app['Tech Health'] > df_original['Tech Health'].quantile(0.95):
-                reasons.append('Exceptional technical health')
-            elif app['Tech Health'] < df_original['Tech Health'].quantile(0.05):
-                reasons.append('Very poor technical health')
-
-            if app['Cost'] > df_original['Cost'].quantile(0.95):
-                reasons.append('Extremely high cost')
-            elif app['Cost'] < df_original['Cost'].quantile(0.05):
-                reasons.append('Unusually low cost')
-
-            if 'Usage' in app and app['Usage'] > df_original['Usage'].quantile(0.95):
-                reasons.append('Very high usage')
-            elif 'Usage' in app and app['Usage'] < df_original['Usage'].quantile(0.05):
-                reasons.append('Minimal usage')
+        for i in range(n_anomalies):
+            reasons = [reason for reason in reason_matrix[i].tolist() if reason]
 
             anomaly_list.append({
-                'application_name': app['Application Name'],
-                'anomaly_score': float(app['Anomaly_Score']),
-                'business_value': float(app['Business Value']),
-                'tech_health': float(app['Tech Health']),
-                'cost': float(app['Cost']),
-                'composite_score': float(app.get('Composite Score', 0)),
-                'recommendation': app.get('Action Recommendation', 'N/A'),
+                'application_name': names[i],
+                'anomaly_score': float(scores[i]),
+                'business_value': float(business_values[i]),
+                'tech_health': float(tech_healths[i]),
+                'cost': float(costs[i]),
+                'composite_score': float(composite_scores[i]),
+                'recommendation': actions[i],
                 'reasons': reasons if reasons else ['Unusual combination of metrics'],
-                'severity': 'High' if app['Anomaly_Score'] < anomalies['Anomaly_Score'].quantile(0.33) else 'Medium'
+                'severity': str(severities[i])
             })
 
         return {
@@ -269,27 +405,95 @@ class MLEngine:
             Trend prediction results
         """
         if len(historical_data) < 3:
-            return {
-                'application_name': app_name,
-                'prediction': 'Insufficient historical data',
-                'confidence': 0,
-                'trend': 'unknown'
-            }
+            return self._insufficient_trend_result(app_name)
+
+        # Scores in chronological order, undated snapshots last
+        history = sorted(historical_data, key=_snapshot_order)
+        scores = np.array([snapshot['composite_score'] for snapshot in history], dtype=np.float64)
 
-        # Convert to DataFrame
-        df_history = pd.DataFrame(historical_data)
-        df_history = df_history.sort_values('assessment_timestamp')
+        # Simple linear regression for trend (closed form for x = 0..n-1)
+        n = len(scores)
+        x_centered = np.arange(n) - (n - 1) / 2
+        y_mean = scores.mean()
+        slope = (x_centered * (scores - y_mean)).sum() / (x_centered ** 2).sum()
+        intercept = y_mean - slope * (n - 1) / 2
 
-        # Calculate trends
-        scores = df_history['composite_score'].values
-        timestamps = pd.to_datetime(df_history['assessment_timestamp'])
+        return self._build_trend_result(
+            app_name, scores[-1], slope, intercept, n, float(np.std(scores))
+        )
+
+    def predict_trends_batch(
+        self,
+        histories: Dict[str, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict future trends for many applications in one vectorized pass.
+
+        Args:
+            histories: Mapping of application name to its historical snapshots
+
+        Returns:
+            List of trend prediction results, in the order of ``histories``
+        """
+        app_names = list(histories)
+        if not app_names:
+            return []
+
+        # Pad every history into one (apps, T) matrix; NaN marks missing points
+        max_len = max(len(history) for history in histories.values())
+        scores = np.full((len(app_names), max(max_len, 1)), np.nan)
+        for row, app_name in enumerate(app_names):
+            history = sorted(histories[app_name], key=_snapshot_order)
+            scores[row, :len(history)] = [snapshot['composite_score'] for snapshot in history]
+
+        valid = ~np.isnan(scores)
+        n = valid.sum(axis=1)
+        safe_n = np.maximum(n, 1)
+
+        # Closed-form least squares along axis=1, ignoring padded points
+        x_mean = (n - 1) / 2
+        y_mean = np.where(valid, scores, 0).sum(axis=1) / safe_n
+        x_centered = np.where(valid, np.arange(scores.shape[1]) - x_mean[:, None], 0)
+        y_centered = np.where(valid, scores - y_mean[:, None], 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            slopes = (x_centered * y_centered).sum(axis=1) / (x_centered ** 2).sum(axis=1)
+        intercepts = y_mean - slopes * x_mean
+        volatility = np.sqrt((y_centered ** 2).sum(axis=1) / safe_n)
+        current = scores[np.arange(len(app_names)), np.maximum(n - 1, 0)]
+
+        results = []
+        for row, app_name in enumerate(app_names):
+            if n[row] < 3:
+                results.append(self._insufficient_trend_result(app_name))
+            else:
+                results.append(self._build_trend_result(
+                    app_name, current[row], slopes[row], intercepts[row],
+                    int(n[row]), float(volatility[row])
+                ))
+
+        return results
 
-        # Simple linear regression for trend
-        x = np.arange(len(scores))
-        slope, intercept = np.polyfit(x, scores, 1)
+    def _insufficient_trend_result(self, app_name: str) -> Dict[str, Any]:
+        """Trend result for applications with fewer than 3 snapshots"""
+        return {
+            'application_name': app_name,
+            'prediction': 'Insufficient historical data',
+            'confidence': 0,
+            'trend': 'unknown'
+        }
 
+    def _build_trend_result(
+        self,
+        app_name: str,
+        current_score: float,
+        slope: float,
+        intercept: float,
+        data_points: int,
+        volatility: float
+    ) -> Dict[str, Any]:
+        """Turn a fitted linear trend into a prediction result"""
         # Predict next score
-        next_score = slope * len(scores) + intercept
+        next_score = slope * data_points + intercept
         next_score = max(0, min(100, next_score))  # Clamp to 0-100
 
         # Determine trend
@@ -303,19 +507,16 @@ class MLEngine:
             trend = 'stable'
             confidence = 0.6
 
-        # Calculate volatility
-        volatility = float(np.std(scores))
-
         return {
             'application_name': app_name,
-            'current_score': float(scores[-1]),
+            'current_score': float(current_score),
             'predicted_next_score': float(next_score),
             'trend': trend,
             'trend_rate': float(slope),
             'confidence': float(confidence),
             'volatility': volatility,
-            'data_points': len(scores),
-            'recommendation': self._get_trend_recommendation(trend, scores[-1], next_score)
+            'data_points': data_points,
+            'recommendation': self._get_trend_recommendation(trend, current_score, next_score)
         }
 
     def _get_trend_recommendation(
@@ -360,18 +561,28 @@ class MLEngine:
             'consolidation_targets': []
         }
 
-        # Prepare features
-        X_scaled, df_original = self.prepare_features(df)
-
-        # Retirement candidates: Low value, poor health, high cost
-        df_scored = df_original.copy()
-        df_scored['retirement_score'] = (
-            (10 - df_scored['Business Value']) * 0.4 +
-            (10 - df_scored['Tech Health']) * 0.3 +
-            (df_scored['Cost'] / df_scored['Cost'].max()) * 10 * 0.3
+        # Prepare features, keeping the scaler the clustering model was trained with
+        X_scaled, df_original = self.prepare_features(df, refit=self.clustering_model is None)
+
+        # Score only the columns the recommendations report
+        df_scored = df_original[[
+            column for column in ('Application Name', 'Business Value', 'Tech Health', 'Cost', 'Composite Score')
+            if column in df_original.columns
+        ]]
+        business_value = df_scored['Business Value']
+        tech_health = df_scored['Tech Health']
+        cost_ratio = df_scored['Cost'] / df_scored['Cost'].max()
+        df_scored = df_scored.assign(
+            # Retirement candidates: Low value, poor health, high cost
+            retirement_score=(10 - business_value) * 0.4 + (10 - tech_health) * 0.3 + cost_ratio * 10 * 0.3,
+            # Investment opportunities: High value, good health, strategic
+            investment_score=business_value * 0.4 + tech_health * 0.3 + df_original.get('Strategic Fit', 5) * 0.3,
+            # Quick wins: Medium value, poor health, low cost to fix
+            quick_win_score=business_value * 0.5 + (10 - tech_health) * 0.3 + (1 - cost_ratio) * 10 * 0.2
         )
 
-        retirement = df_scored.nlargest(top_n, 'retirement_score')
+        # Retirement candidates
+        retirement = df_scored.iloc[top_n_positions(df_scored['retirement_score'].to_numpy(), top_n)]
         for _, app in retirement.iterrows():
             recommendations['retirement_candidates'].append({
                 'application_name': app['Application Name'],
@@ -381,14 +592,8 @@ class MLEngine:
                 'reason': f"Low value ({app['Business Value']:.1f}), poor health ({app['Tech Health']:.1f}), costs ${app['Cost']:,.0f}/year"
             })
 
-        # Investment opportunities: High value, good health, strategic
-        df_scored['investment_score'] = (
-            df_scored['Business Value'] * 0.4 +
-            df_scored['Tech Health'] * 0.3 +
-            df_scored.get('Strategic Fit', 5) * 0.3
-        )
-
-        investment = df_scored.nlargest(top_n, 'investment_score')
+        # Investment opportunities
+        investment = df_scored.iloc[top_n_positions(df_scored['investment_score'].to_numpy(), top_n)]
         for _, app in investment.iterrows():
             recommendations['investment_opportunities'].append({
                 'application_name': app['Application Name'],
@@ -397,14 +602,8 @@ class MLEngine:
                 'reason': f"High value ({app['Business Value']:.1f}), good health ({app['Tech Health']:.1f})"
             })
 
-        # Quick wins: Medium value, poor health, low cost to fix
-        df_scored['quick_win_score'] = (
-            df_scored['Business Value'] * 0.5 +
-            (10 - df_scored['Tech Health']) * 0.3 +
-            (1 - df_scored['Cost'] / df_scored['Cost'].max()) * 10 * 0.2
-        )
-
-        quick_wins = df_scored.nlargest(top_n, 'quick_win_score')
+        # Quick wins
+        quick_wins = df_scored.iloc[top_n_positions(df_scored['quick_win_score'].to_numpy(), top_n)]
         for _, app in quick_wins.iterrows():
             recommendations['quick_wins'].append({
                 'application_name': app['Application Name'],
@@ -418,35 +617,59 @@ class MLEngine:
             cluster_labels = self.clustering_model.predict(X_scaled)
             df_scored['cluster'] = cluster_labels
 
-            # Find clusters with multiple apps
-            for cluster_id in range(self.clustering_model.n_clusters):
-                cluster_apps = df_scored[df_scored['cluster'] == cluster_id]
-                if len(cluster_apps) > 2:
-                    # Sort by score, keep best one
-                    cluster_apps_sorted = cluster_apps.sort_values('Composite Score', ascending=False)
-                    for _, app in cluster_apps_sorted[1:top_n+1].iterrows():
+            # Sort once by cluster then score, so each group is already ranked
+            df_ranked = df_scored.sort_values(['cluster', 'Composite Score'], ascending=[True, False])
+
+            # Find clusters with multiple apps, keep the best one in each
+            for cluster_id, cluster_apps_sorted in df_ranked.groupby('cluster', sort=False):
+                if len(cluster_apps_sorted) > 2:
+                    app_names = cluster_apps_sorted['Application Name']
+                    best_app = app_names.iloc[0]
+                    for app_name in app_names.iloc[1:top_n+1]:
                         recommendations['consolidation_targets'].append({
-                            'application_name': app['Application Name'],
+                            'application_name': app_name,
                             'cluster_id': int(cluster_id),
-                            'similar_apps': cluster_apps_sorted.iloc[0]['Application Name'],
+                            'similar_apps': best_app,
                             'reason': 'Similar functionality to better-performing application'
                         })
 
         return recommendations
 
+    def _model_file(self, attr: str) -> Optional[Path]:
+        """Saved file for a model attribute, preferring .joblib over a legacy .pkl"""
+        for filename in (self.MODEL_FILES[attr], self.LEGACY_MODEL_FILES[attr]):
+            path = self.model_path / filename
+            if path.exists():
+                return path
+        return None
+
+    def _mark_models_modified(self):
+        """Forget the saved-file mtimes so the next load_models() reloads from disk"""
+        self._model_mtimes = {}
+
+    def _get_model_mtimes(self) -> Dict[str, float]:
+        """Get modification times of the model files currently on disk"""
+        mtimes = {}
+        for attr in self.MODEL_FILES:
+            path = self._model_file(attr)
+            if path is not None:
+                mtimes[path.name] = path.stat().st_mtime
+        return mtimes
+
     def save_models(self):
         """Save trained models to disk"""
         try:
+            # Uncompressed so the NumPy arrays inside the models can be memory-mapped on load
             if self.clustering_model:
-                with open(self.model_path / 'clustering_model.pkl', 'wb') as f:
-                    pickle.dump(self.clustering_model, f)
+                joblib.dump(self.clustering_model, self.model_path / self.MODEL_FILES['clustering_model'])
 
             if self.anomaly_detector:
-                with open(self.model_path / 'anomaly_detector.pkl', 'wb') as f:
-                    pickle.dump(self.anomaly_detector, f)
+                joblib.dump(self.anomaly_detector, self.model_path / self.MODEL_FILES['anomaly_detector'])
+
+            joblib.dump(self.scaler, self.model_path / self.MODEL_FILES['scaler'])
 
-            with open(self.model_path / 'scaler.pkl', 'wb') as f:
-                pickle.dump(self.scaler, f)
+            # In-memory models now match the files, so the next load can be skipped
+            self._model_mtimes = self._get_model_mtimes()
 
             logger.info(f"Models saved to {self.model_path}")
         except Exception as e:
@@ -455,20 +678,28 @@ class MLEngine:
     def load_models(self):
         """Load trained models from disk"""
         try:
-            clustering_path = self.model_path / 'clustering_model.pkl'
-            if clustering_path.exists():
-                with open(clustering_path, 'rb') as f:
-                    self.clustering_model = pickle.load(f)
-
-            anomaly_path = self.model_path / 'anomaly_detector.pkl'
-            if anomaly_path.exists():
-                with open(anomaly_path, 'rb') as f:
-                    self.anomaly_detector = pickle.load(f)
-
-            scaler_path = self.model_path / 'scaler.pkl'
-            if scaler_path.exists():
-                with open(scaler_path, 'rb') as f:
-                    self.scaler = pickle.load(f)
+            mtimes = self._get_model_mtimes()
+            if not mtimes:
+                logger.warning(f"No saved models found in {self.model_path}")
+                return False
+            if mtimes == self._model_mtimes:
+                logger.debug(f"Models in {self.model_path} unchanged since last load")
+                return True
+
+            for attr in self.MODEL_FILES:
+                path = self._model_file(attr)
+                if path is None:
+                    continue
+                if path.suffix == '.joblib':
+                    # Read-only memory map: fitted arrays stay on disk until touched
+                    setattr(self, attr, joblib.load(path, mmap_mode='r'))
+                else:
+                    # Plain pickle from an earlier version; joblib reads it as-is
+                    setattr(self, attr, joblib.load(path))
+
+            # Cached features were scaled by the scaler that was just replaced
+            self.clear_feature_cache()
+            self._model_mtimes = mtimes
 
             logger.info(f"Models loaded from {self.model_path}")
             return True
@@ -5,9 +5,76 @@ Allow users to query portfolio data using natural language
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+import copy
 import re
 
+from .array_utils import frame_snapshot, top_n_positions
+
+
+def _risk_scores(health: np.ndarray, value: np.ndarray) -> np.ndarray:
+    """Risk score per application: poor health weighted with high business value"""
+    return ((10.0 - health) * 0.4 + value * 0.6) * 10.0
+
+
+def _downcast_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Downcast whole-number scores to int8 so filter masks scan fewer bytes.
+
+    Fractional, missing or out-of-range scores are returned unchanged.
+    """
+    if scores.dtype.kind not in 'iuf' or scores.size == 0:
+        return scores
+    if scores.dtype.kind == 'f' and not np.isfinite(scores).all():
+        return scores
+    if scores.min() < -128 or scores.max() > 127:
+        return scores
+    compact = scores.astype(np.int8)
+    return compact if np.array_equal(compact, scores) else scores
+
+
+def _limited_records(frame: pd.DataFrame, max_records: Optional[int]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Rows of a frame as one dict per application, at most max_records of them.
+
+    Returns:
+        Tuple of (records, truncated); None for max_records returns every row
+    """
+    if max_records is None or len(frame) <= max_records:
+        return frame.to_dict('records'), False
+    return frame.head(max_records).to_dict('records'), True
+
+
+# Suggestions offered when a query is not recognised
+_QUERY_SUGGESTIONS = (
+    'How many applications do we have?',
+    'What is the total cost?',
+    'Show unhealthy applications',
+    'Which apps should we retire?',
+    'What are the highest risk applications?',
+    'How much can we save?',
+    'Show applications by category',
+    'What do you recommend?'
+)
+
+# Example queries listed by get_example_queries()
+_EXAMPLE_QUERIES = (
+    'How many applications do we have?',
+    'What is the total annual cost?',
+    'Show me unhealthy applications',
+    'Which applications should we retire?',
+    'What apps need modernization?',
+    'Show highest risk applications',
+    'How much can we save?',
+    'What is the average health score?',
+    'Show applications in the Financial category',
+    'What do you recommend?',
+    'Which are the most expensive apps?',
+    'Show high-value applications',
+    'Compare best and worst applications'
+)
+
 
 class NaturalLanguageQueryEngine:
     """Process natural language queries about application portfolio"""
@@ -128,39 +195,177 @@ class NaturalLanguageQueryEngine:
         }
     }
 
+    # Each type's patterns fused into one compiled alternation: (query_type, regex)
+    _COMPILED_PATTERNS = [
+        (query_type, re.compile('|'.join(f'(?:{pattern})' for pattern in config['patterns'])))
+        for query_type, config in QUERY_PATTERNS.items()
+    ]
+
+    # Maximum number of query results kept for repeated queries
+    RESULT_CACHE_SIZE = 128
+
+    # Query types whose handlers list applications and accept max_records
+    _LISTING_TYPES = frozenset({'health', 'value', 'retire', 'modernize', 'category'})
+
     def __init__(self, df_applications: pd.DataFrame):
-        """Initialize with application portfolio data"""
-        self.df = df_applications.copy()
+        """
+        Initialize with application portfolio data.
+
+        The engine keeps a snapshot of the data (sharing the caller's columns
+        when pandas Copy-on-Write is on), so later edits by the caller don't
+        reach the cached answers.
+        """
+        self.df = frame_snapshot(df_applications)
+
+        # Bound handler for each query type, resolved once
+        self._handlers = {
+            query_type: getattr(self, config['handler'])
+            for query_type, config in self.QUERY_PATTERNS.items()
+        }
 
-    def process_query(self, query: str) -> Dict[str, Any]:
-        """Process a natural language query"""
+        # Results of recognised queries, keyed by the normalised query text
+        # and the record limit they were answered with
+        self._results: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+
+        self._cache_columns()
+
+    def _cache_columns(self):
+        """Extract the score and cost columns as NumPy arrays, reused by every handler"""
+        self._health = _downcast_scores(self.df['Tech Health'].to_numpy())
+        self._value = _downcast_scores(self.df['Business Value'].to_numpy())
+        self._cost = self.df['Cost'].to_numpy()
+        self._cost_sum = self.df['Cost'].sum()
+        self._n = len(self.df)
+
+        # Row positions of the candidate segments several handlers share
+        self._retire_idx = np.flatnonzero((self._health <= 3) & (self._value <= 4))
+        # High value + low health: modernization priorities, also the high-risk set
+        self._modernize_idx = np.flatnonzero((self._value >= 7) & (self._health <= 5))
+        self._invest_idx = np.flatnonzero((self._value >= 7) & (self._health >= 7))
+
+        # Cost of the retire and modernize segments, skipping missing costs
+        self._retire_cost = np.nansum(self._cost[self._retire_idx])
+        self._modernize_cost = np.nansum(self._cost[self._modernize_idx])
+
+        # Category as a categorical column; its names are lower-cased once for
+        # matching against queries, in order of first appearance
+        if 'Category' in self.df.columns:
+            self.df['Category'] = self.df['Category'].astype('category')
+            categories = self.df['Category'].unique()
+            self._category_count = len(categories)
+            self._categories_lower = [(cat.lower(), cat) for cat in categories if isinstance(cat, str)]
+
+    def invalidate(self):
+        """Drop cached query results and column arrays after self.df itself has been modified"""
+        self._results.clear()
+        self._cache_columns()
+
+    def process_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Process a natural language query.
+
+        Args:
+            query: Natural language query
+            max_records: Maximum number of applications listed in the result
+                data; counts and totals still cover every match, and
+                data['truncated'] says whether the list was cut. None lists all.
+
+        Returns:
+            Query result
+        """
 
         query_lower = query.lower().strip()
 
-        # Match query to pattern
-        matched_type = None
-        for query_type, config in self.QUERY_PATTERNS.items():
-            for pattern in config['patterns']:
-                if re.search(pattern, query_lower):
-                    matched_type = query_type
-                    break
-            if matched_type:
-                break
-
-        if not matched_type:
+        # Repeated queries are answered from the cache
+        cached = self._results.get((query_lower, max_records))
+        if cached is not None:
+            return self._copy_result(cached)
+
+        return self._run_query(query, query_lower, self._classify(query_lower), max_records)
+
+    def process_queries(
+        self,
+        queries: List[str],
+        max_records: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process a batch of natural language queries.
+
+        Queries are classified first and then answered grouped by query type,
+        so each handler runs back to back over the data it touches. Repeated
+        queries within the batch are answered once.
+
+        Args:
+            queries: Natural language queries
+            max_records: Maximum number of applications listed per result, as
+                for process_query()
+
+        Returns:
+            One result per query, in the order given
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        batches: Dict[Optional[str], List[Tuple[int, str, str]]] = defaultdict(list)
+
+        for position, query in enumerate(queries):
+            query_lower = query.lower().strip()
+            cached = self._results.get((query_lower, max_records))
+            if cached is not None:
+                results[position] = self._copy_result(cached)
+            else:
+                batches[self._classify(query_lower)].append((position, query, query_lower))
+
+        for query_type, batch in batches.items():
+            for position, query, query_lower in batch:
+                cached = self._results.get((query_lower, max_records))
+                if cached is not None:
+                    results[position] = self._copy_result(cached)
+                else:
+                    results[position] = self._run_query(query, query_lower, query_type, max_records)
+
+        return results
+
+    def _classify(self, query_lower: str) -> Optional[str]:
+        """Query type of a normalised query, or None if it is not recognised"""
+        # The first type with any matching pattern wins
+        for query_type, regex in self._COMPILED_PATTERNS:
+            if regex.search(query_lower):
+                return query_type
+        return None
+
+    def _run_query(
+        self,
+        query: str,
+        query_lower: str,
+        query_type: Optional[str],
+        max_records: Optional[int]
+    ) -> Dict[str, Any]:
+        """Answer a classified query and cache the result"""
+        if query_type is None:
             return self.handle_unknown_query(query)
 
         # Call appropriate handler
-        handler_name = self.QUERY_PATTERNS[matched_type]['handler']
-        handler = getattr(self, handler_name)
-        return handler(query_lower)
+        if query_type in self._LISTING_TYPES:
+            result = self._handlers[query_type](query_lower, max_records=max_records)
+        else:
+            result = self._handlers[query_type](query_lower)
+
+        if len(self._results) >= self.RESULT_CACHE_SIZE:
+            del self._results[next(iter(self._results))]
+        self._results[(query_lower, max_records)] = result
+
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached result that callers can edit, nested data included"""
+        return copy.deepcopy(result)
 
     def handle_count_query(self, query: str) -> Dict[str, Any]:
         """Handle count-related queries"""
 
         # Check for filters
         if 'unhealthy' in query or 'poor health' in query:
-            count = len(self.df[self.df['Tech Health'] <= 5])
+            count = int(np.count_nonzero(self._health <= 5))
             return {
                 'query_type': 'count',
                 'answer': f'{count} applications',
@@ -171,7 +376,7 @@ class NaturalLanguageQueryEngine:
                 }
             }
         elif 'high value' in query or 'critical' in query:
-            count = len(self.df[self.df['Business Value'] >= 7])
+            count = int(np.count_nonzero(self._value >= 7))
             return {
                 'query_type': 'count',
                 'answer': f'{count} applications',
@@ -182,7 +387,7 @@ class NaturalLanguageQueryEngine:
                 }
             }
         else:
-            count = len(self.df)
+            count = self._n
             return {
                 'query_type': 'count',
                 'answer': f'{count} applications',
@@ -197,7 +402,7 @@ class NaturalLanguageQueryEngine:
         """Handle cost-related queries"""
 
         if 'most expensive' in query or 'highest cost' in query:
-            top_5 = self.df.nlargest(5, 'Cost')[['Application Name', 'Cost']]
+            top_5 = self.df[['Application Name', 'Cost']].iloc[top_n_positions(self._cost, 5)]
             return {
                 'query_type': 'cost',
                 'answer': f'${top_5.iloc[0]["Cost"]:,.0f} per year',
@@ -207,8 +412,8 @@ class NaturalLanguageQueryEngine:
                 }
             }
         else:
-            total = self.df['Cost'].sum()
-            avg = self.df['Cost'].mean()
+            total = self._cost_sum
+            avg = np.nanmean(self._cost) if self._n > 0 else np.nan
             return {
                 'query_type': 'cost',
                 'answer': f'${total:,.0f} per year',
@@ -216,33 +421,40 @@ class NaturalLanguageQueryEngine:
                 'data': {
                     'total_cost': total,
                     'avg_cost': avg,
-                    'app_count': len(self.df)
+                    'app_count': self._n
                 }
             }
 
-    def handle_health_query(self, query: str) -> Dict[str, Any]:
+    def handle_health_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
         """Handle health-related queries"""
 
         if 'unhealthy' in query or 'poor' in query or 'critical' in query:
-            unhealthy = self.df[self.df['Tech Health'] <= 3]
+            critical = self._health <= 3
+            unhealthy = self.df.loc[critical, ['Application Name', 'Tech Health', 'Business Value', 'Cost']]
+            records, truncated = _limited_records(unhealthy, max_records)
             return {
                 'query_type': 'health',
                 'answer': f'{len(unhealthy)} critical applications',
                 'details': f'{len(unhealthy)} applications have critical health (score ≤ 3)',
                 'data': {
-                    'critical_apps': unhealthy[['Application Name', 'Tech Health', 'Business Value', 'Cost']].to_dict('records'),
+                    'critical_apps': records,
                     'count': len(unhealthy),
-                    'total_cost_at_risk': unhealthy['Cost'].sum()
+                    'total_cost_at_risk': np.nansum(self._cost[critical]),
+                    'truncated': truncated
                 }
             }
         else:
-            avg_health = self.df['Tech Health'].mean()
+            health = self._health
+            avg_health = np.nanmean(health) if self._n > 0 else np.nan
+            # Bucket all scores into the bands in one pass; scores above 10
+            # (or missing) belong to no band
+            bands = np.bincount(np.digitize(health[health <= 10], [4, 6, 8, 10]), minlength=5)
             distribution = {
-                'Excellent (10)': len(self.df[self.df['Tech Health'] == 10]),
-                'Good (8-9)': len(self.df[(self.df['Tech Health'] >= 8) & (self.df['Tech Health'] < 10)]),
-                'Fair (6-7)': len(self.df[(self.df['Tech Health'] >= 6) & (self.df['Tech Health'] < 8)]),
-                'Poor (4-5)': len(self.df[(self.df['Tech Health'] >= 4) & (self.df['Tech Health'] < 6)]),
-                'Critical (1-3)': len(self.df[self.df['Tech Health'] < 4])
+                'Excellent (10)': int(bands[4]),
+                'Good (8-9)': int(bands[3]),
+                'Fair (6-7)': int(bands[2]),
+                'Poor (4-5)': int(bands[1]),
+                'Critical (1-3)': int(bands[0])
             }
             return {
                 'query_type': 'health',
@@ -254,33 +466,37 @@ class NaturalLanguageQueryEngine:
                 }
             }
 
-    def handle_value_query(self, query: str) -> Dict[str, Any]:
+    def handle_value_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
         """Handle business value queries"""
 
         if 'high value' in query or 'critical' in query or 'mission' in query:
-            high_value = self.df[self.df['Business Value'] >= 8]
+            high_value = self.df.loc[self._value >= 8, ['Application Name', 'Business Value', 'Tech Health', 'Cost']]
+            records, truncated = _limited_records(high_value, max_records)
             return {
                 'query_type': 'value',
                 'answer': f'{len(high_value)} mission-critical applications',
                 'details': f'{len(high_value)} applications are mission-critical (value ≥ 8)',
                 'data': {
-                    'critical_apps': high_value[['Application Name', 'Business Value', 'Tech Health', 'Cost']].to_dict('records'),
-                    'count': len(high_value)
+                    'critical_apps': records,
+                    'count': len(high_value),
+                    'truncated': truncated
                 }
             }
         elif 'low value' in query:
-            low_value = self.df[self.df['Business Value'] <= 4]
+            low_value = self.df.loc[self._value <= 4, ['Application Name', 'Business Value', 'Tech Health', 'Cost']]
+            records, truncated = _limited_records(low_value, max_records)
             return {
                 'query_type': 'value',
                 'answer': f'{len(low_value)} low-value applications',
                 'details': f'{len(low_value)} applications have low business value (≤ 4)',
                 'data': {
-                    'low_value_apps': low_value[['Application Name', 'Business Value', 'Tech Health', 'Cost']].to_dict('records'),
-                    'count': len(low_value)
+                    'low_value_apps': records,
+                    'count': len(low_value),
+                    'truncated': truncated
                 }
             }
         else:
-            avg_value = self.df['Business Value'].mean()
+            avg_value = np.nanmean(self._value) if self._n > 0 else np.nan
             return {
                 'query_type': 'value',
                 'answer': f'Average value: {avg_value:.1f}/10',
@@ -290,40 +506,44 @@ class NaturalLanguageQueryEngine:
                 }
             }
 
-    def handle_retire_query(self, query: str) -> Dict[str, Any]:
+    def handle_retire_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
         """Handle retirement candidate queries"""
 
         # Low health + Low value = retire
-        retire_candidates = self.df[(self.df['Tech Health'] <= 3) & (self.df['Business Value'] <= 4)]
+        retire_candidates = self.df[['Application Name', 'Tech Health', 'Business Value', 'Cost']].iloc[self._retire_idx]
 
-        total_savings = retire_candidates['Cost'].sum()
+        total_savings = self._retire_cost
+        records, truncated = _limited_records(retire_candidates, max_records)
 
         return {
             'query_type': 'retire',
             'answer': f'{len(retire_candidates)} retirement candidates',
             'details': f'{len(retire_candidates)} applications are candidates for retirement (low health & low value)',
             'data': {
-                'candidates': retire_candidates[['Application Name', 'Tech Health', 'Business Value', 'Cost']].to_dict('records'),
+                'candidates': records,
                 'count': len(retire_candidates),
                 'potential_savings': total_savings,
-                'savings_percentage': (total_savings / self.df['Cost'].sum() * 100) if len(self.df) > 0 else 0
+                'savings_percentage': (total_savings / self._cost_sum * 100) if self._n > 0 else 0,
+                'truncated': truncated
             }
         }
 
-    def handle_modernize_query(self, query: str) -> Dict[str, Any]:
+    def handle_modernize_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
         """Handle modernization queries"""
 
         # High value + Low health = modernize
-        modernize_candidates = self.df[(self.df['Business Value'] >= 7) & (self.df['Tech Health'] <= 5)]
+        modernize_candidates = self.df[['Application Name', 'Tech Health', 'Business Value', 'Cost']].iloc[self._modernize_idx]
+        records, truncated = _limited_records(modernize_candidates, max_records)
 
         return {
             'query_type': 'modernize',
             'answer': f'{len(modernize_candidates)} modernization priorities',
             'details': f'{len(modernize_candidates)} high-value applications need modernization (value ≥ 7, health ≤ 5)',
             'data': {
-                'candidates': modernize_candidates[['Application Name', 'Tech Health', 'Business Value', 'Cost']].to_dict('records'),
+                'candidates': records,
                 'count': len(modernize_candidates),
-                'total_cost_at_risk': modernize_candidates['Cost'].sum()
+                'total_cost_at_risk': self._modernize_cost,
+                'truncated': truncated
             }
         }
 
@@ -331,14 +551,12 @@ class NaturalLanguageQueryEngine:
         """Handle risk-related queries"""
 
         # High risk: Low health + High value
-        high_risk = self.df[(self.df['Tech Health'] <= 5) & (self.df['Business Value'] >= 7)]
+        high_risk = self.df[['Application Name', 'Tech Health', 'Business Value', 'Cost']].iloc[self._modernize_idx]
 
-        # Calculate risk score (simple)
-        def calc_risk(row):
-            return ((10 - row['Tech Health']) * 0.4 + row['Business Value'] * 0.6) * 10
-
-        high_risk = high_risk.copy()
-        high_risk['risk_score'] = high_risk.apply(calc_risk, axis=1)
+        # Calculate risk score (simple), vectorized over the selected rows
+        health = high_risk['Tech Health'].to_numpy(dtype=np.float64)
+        value = high_risk['Business Value'].to_numpy(dtype=np.float64)
+        high_risk = high_risk.assign(risk_score=_risk_scores(health, value))
         high_risk = high_risk.sort_values('risk_score', ascending=False)
 
         return {
@@ -356,15 +574,13 @@ class NaturalLanguageQueryEngine:
         """Handle cost savings queries"""
 
         # Calculate savings opportunities
-        retire_candidates = self.df[(self.df['Tech Health'] <= 3) & (self.df['Business Value'] <= 4)]
-        retire_savings = retire_candidates['Cost'].sum()
+        retire_savings = self._retire_cost
 
         # Consolidation opportunities (apps with similar functionality)
-        consolidation_savings = self.df['Cost'].sum() * 0.10  # Estimate 10% from consolidation
+        consolidation_savings = self._cost_sum * 0.10  # Estimate 10% from consolidation
 
         # Modernization savings (maintenance reduction)
-        modernize_candidates = self.df[(self.df['Business Value'] >= 7) & (self.df['Tech Health'] <= 5)]
-        modernization_savings = modernize_candidates['Cost'].sum() * 0.20  # 20% maintenance reduction
+        modernization_savings = self._modernize_cost * 0.20  # 20% maintenance reduction
 
         total_savings = retire_savings + consolidation_savings + modernization_savings
 
@@ -377,29 +593,30 @@ class NaturalLanguageQueryEngine:
                 'consolidation_savings': consolidation_savings,
                 'modernization_savings': modernization_savings,
                 'total_savings': total_savings,
-                'savings_percentage': (total_savings / self.df['Cost'].sum() * 100) if len(self.df) > 0 else 0,
+                'savings_percentage': (total_savings / self._cost_sum * 100) if self._n > 0 else 0,
                 'breakdown': [
-                    {'category': 'Retirement', 'amount': retire_savings, 'apps': len(retire_candidates)},
+                    {'category': 'Retirement', 'amount': retire_savings, 'apps': len(self._retire_idx)},
                     {'category': 'Consolidation', 'amount': consolidation_savings, 'apps': 'Various'},
-                    {'category': 'Modernization', 'amount': modernization_savings, 'apps': len(modernize_candidates)}
+                    {'category': 'Modernization', 'amount': modernization_savings, 'apps': len(self._modernize_idx)}
                 ]
             }
         }
 
-    def handle_category_query(self, query: str) -> Dict[str, Any]:
+    def handle_category_query(self, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
         """Handle category-specific queries"""
 
         # Try to extract category name from query
         category = None
-        categories = self.df['Category'].unique()
-
-        for cat in categories:
-            if cat.lower() in query:
+        for cat_lower, cat in self._categories_lower:
+            if cat_lower in query:
                 category = cat
                 break
 
         if category:
             cat_apps = self.df[self.df['Category'] == category]
+            records, truncated = _limited_records(
+                cat_apps[['Application Name', 'Tech Health', 'Business Value', 'Cost']], max_records
+            )
             return {
                 'query_type': 'category',
                 'answer': f'{len(cat_apps)} applications in {category}',
@@ -410,22 +627,23 @@ class NaturalLanguageQueryEngine:
                     'total_cost': cat_apps['Cost'].sum(),
                     'avg_health': cat_apps['Tech Health'].mean(),
                     'avg_value': cat_apps['Business Value'].mean(),
-                    'applications': cat_apps[['Application Name', 'Tech Health', 'Business Value', 'Cost']].to_dict('records')
+                    'applications': records,
+                    'truncated': truncated
                 }
             }
         else:
             # Return category summary
-            cat_summary = self.df.groupby('Category').agg({
-                'Application Name': 'count',
-                'Cost': 'sum',
-                'Tech Health': 'mean',
-                'Business Value': 'mean'
+            cat_summary = self.df.groupby('Category', observed=True).agg(**{
+                'Application Name': ('Application Name', 'count'),
+                'Cost': ('Cost', 'sum'),
+                'Tech Health': ('Tech Health', 'mean'),
+                'Business Value': ('Business Value', 'mean')
             }).round(2).to_dict('index')
 
             return {
                 'query_type': 'category',
-                'answer': f'{len(categories)} categories',
-                'details': f'Portfolio has {len(categories)} application categories',
+                'answer': f'{self._category_count} categories',
+                'details': f'Portfolio has {self._category_count} application categories',
                 'data': {
                     'categories': cat_summary
                 }
@@ -435,8 +653,10 @@ class NaturalLanguageQueryEngine:
         """Handle comparison queries"""
 
         # Simple comparison: best vs worst
-        best_health = self.df.nlargest(5, 'Tech Health')[['Application Name', 'Tech Health', 'Business Value', 'Cost']]
-        worst_health = self.df.nsmallest(5, 'Tech Health')[['Application Name', 'Tech Health', 'Business Value', 'Cost']]
+        columns = self.df[['Application Name', 'Tech Health', 'Business Value', 'Cost']]
+        health = self._health.astype(np.float64)
+        best_health = columns.iloc[top_n_positions(health, 5)]
+        worst_health = columns.iloc[top_n_positions(-health, 5)]
 
         return {
             'query_type': 'comparison',
@@ -455,34 +675,34 @@ class NaturalLanguageQueryEngine:
         recommendations = []
 
         # Retirement recommendations
-        retire = self.df[(self.df['Tech Health'] <= 3) & (self.df['Business Value'] <= 4)]
-        if len(retire) > 0:
+        retire_count = len(self._retire_idx)
+        if retire_count > 0:
             recommendations.append({
                 'priority': 'High',
                 'action': 'Retire',
-                'count': len(retire),
+                'count': retire_count,
                 'reason': 'Low health and low business value',
-                'savings': retire['Cost'].sum()
+                'savings': self._retire_cost
             })
 
         # Modernization recommendations
-        modernize = self.df[(self.df['Business Value'] >= 7) & (self.df['Tech Health'] <= 5)]
-        if len(modernize) > 0:
+        modernize_count = len(self._modernize_idx)
+        if modernize_count > 0:
             recommendations.append({
                 'priority': 'Urgent',
                 'action': 'Modernize',
-                'count': len(modernize),
+                'count': modernize_count,
                 'reason': 'Critical applications with poor health',
                 'risk_mitigation': 'Prevent business disruption'
             })
 
         # Investment recommendations
-        invest = self.df[(self.df['Business Value'] >= 7) & (self.df['Tech Health'] >= 7)]
-        if len(invest) > 0:
+        invest_count = len(self._invest_idx)
+        if invest_count > 0:
             recommendations.append({
                 'priority': 'Medium',
                 'action': 'Invest',
-                'count': len(invest),
+                'count': invest_count,
                 'reason': 'High-value applications in good health',
                 'opportunity': 'Continue innovation'
             })
@@ -511,24 +731,12 @@ class NaturalLanguageQueryEngine:
     def handle_unknown_query(self, query: str) -> Dict[str, Any]:
         """Handle unrecognized queries"""
 
-        # Provide helpful suggestions
-        suggestions = [
-            'How many applications do we have?',
-            'What is the total cost?',
-            'Show unhealthy applications',
-            'Which apps should we retire?',
-            'What are the highest risk applications?',
-            'How much can we save?',
-            'Show applications by category',
-            'What do you recommend?'
-        ]
-
         return {
             'query_type': 'unknown',
             'answer': 'Query not recognized',
             'details': f'Could not understand query: "{query}"',
             'data': {
-                'suggestions': suggestions,
+                'suggestions': list(_QUERY_SUGGESTIONS),
                 'query': query
             }
         }
@@ -536,18 +744,4 @@ class NaturalLanguageQueryEngine:
     def get_example_queries(self) -> List[str]:
         """Get list of example queries"""
 
-        return [
-            'How many applications do we have?',
-            'What is the total annual cost?',
-            'Show me unhealthy applications',
-            'Which applications should we retire?',
-            'What apps need modernization?',
-            'Show highest risk applications',
-            'How much can we save?',
-            'What is the average health score?',
-            'Show applications in the Financial category',
-            'What do you recommend?',
-            'Which are the most expensive apps?',
-            'Show high-value applications',
-            'Compare best and worst applications'
-        ]
+        return list(_EXAMPLE_QUERIES)
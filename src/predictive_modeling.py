@@ -3,9 +3,19 @@ Predictive Cost & Risk Modeling Module
 Forecasts future portfolio costs and risks without complex ML
 """
 
+import re
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any
 
+# Action recommendations that retire an application
+_RETIRE_PATTERN = re.compile(r'Retire|Eliminate', re.IGNORECASE)
+
+
+def _risk_scores(health: np.ndarray, cost: np.ndarray) -> np.ndarray:
+    """Risk score per application: poor health weighted by normalized cost"""
+    return (10.0 - health) * (cost / 10000.0)
+
 
 class PredictiveModeler:
     """Simple predictive modeling for application portfolio costs and risks"""
@@ -33,22 +43,23 @@ class PredictiveModeler:
         # Lower tech health = higher growth rate
         avg_tech_health = df['Tech Health'].mean() if 'Tech Health' in df.columns else 5.0
 
-        forecasts = []
-        for year in range(1, years + 1):
-            # Base inflation (3%) + aging factor (up to 5% for poor tech health)
-            inflation_rate = 0.03
-            aging_rate = 0.05 * (1 - avg_tech_health / 10)  # Scales with poor health
-            growth_rate = inflation_rate + aging_rate
+        # Base inflation (3%) + aging factor (up to 5% for poor tech health)
+        inflation_rate = 0.03
+        aging_rate = 0.05 * (1 - avg_tech_health / 10)  # Scales with poor health
+        growth_rate = float(inflation_rate + aging_rate)
 
-            projected_cost = current_total * ((1 + growth_rate) ** year)
+        # Compound growth for every forecast year at once
+        forecast_years = np.arange(1, years + 1)
+        projected_costs = current_total * (1 + growth_rate) ** forecast_years
 
-            forecasts.append({
-                'year': year,
+        return [
+            {
+                'year': int(year),
                 'projected_cost': float(projected_cost),
-                'growth_rate': float(growth_rate)
-            })
-
-        return forecasts
+                'growth_rate': growth_rate
+            }
+            for year, projected_cost in zip(forecast_years, projected_costs)
+        ]
 
     def predict_high_risk_apps(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
@@ -75,20 +86,29 @@ class PredictiveModeler:
         # Risk score: combines poor health with high costs
         # (10 - health) gives higher score for lower health
         # Divide cost by 10000 to normalize scale
-        at_risk['risk_score'] = (10 - at_risk['Tech Health']) * (at_risk['Cost'] / 10000)
+        at_risk['risk_score'] = _risk_scores(
+            at_risk['Tech Health'].to_numpy(dtype=np.float64),
+            at_risk['Cost'].to_numpy(dtype=np.float64)
+        )
         at_risk = at_risk.sort_values('risk_score', ascending=False)
 
-        # Return top 10 at-risk applications
-        result = []
-        for _, row in at_risk.head(10).iterrows():
-            result.append({
-                'name': row['Application Name'],
-                'technical_health': float(row['Tech Health']),
-                'annual_cost': float(row['Cost']),
-                'risk_score': float(row['risk_score'])
-            })
-
-        return result
+        # Return top 10 at-risk applications, built from the column arrays
+        top = at_risk.head(10)
+        columns = zip(
+            top['Application Name'].to_numpy(),
+            top['Tech Health'].to_numpy(),
+            top['Cost'].to_numpy(),
+            top['risk_score'].to_numpy()
+        )
+        return [
+            {
+                'name': name,
+                'technical_health': float(health),
+                'annual_cost': float(cost),
+                'risk_score': float(risk_score)
+            }
+            for name, health, cost, risk_score in columns
+        ]
 
     def calculate_roi_timeline(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -106,10 +126,15 @@ class PredictiveModeler:
                 'savings': 0
             }
 
-        # Find retirement candidates
-        retire_candidates = df[
-            df['Action Recommendation'].str.contains('Retire|Eliminate', case=False, na=False)
-        ]
+        # Find retirement candidates: match the pattern once per distinct action
+        # (there are only a handful) and map the result back onto the rows.
+        # The trailing False is picked up by the -1 code of missing actions.
+        codes, actions = pd.factorize(df['Action Recommendation'])
+        is_retire_action = np.array(
+            [isinstance(action, str) and bool(_RETIRE_PATTERN.search(action)) for action in actions] + [False],
+            dtype=bool
+        )
+        retire_candidates = df[is_retire_action[codes]]
 
         if len(retire_candidates) == 0:
             return {
@@ -3,9 +3,16 @@ Recommendation Engine Module
 Generates actionable recommendations for application rationalization.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
 from enum import Enum
+from string import Formatter
+from types import SimpleNamespace
 import logging
+import operator
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +29,192 @@ class ActionType(Enum):
     RETIRE = "Retire"
     IMMEDIATE_ACTION = "Immediate Action Required"
 
+    @property
+    def code(self) -> int:
+        """Integer code of the action (position in definition order)."""
+        return _ACTION_CODES[self]
+
+
+# Threshold comparisons the decision rules are written in:
+# (name, score, comparison, RecommendationEngine threshold attribute); a None
+# comparison means the input is already a flag. "Below" and "at least" the
+# same threshold are separate comparisons so that a NaN score fails both.
+_RULE_COMPARISONS: Tuple[Tuple[str, str, Optional[Callable], Optional[str]], ...] = (
+    ('poor_security', 'security', operator.le, 'POOR_SECURITY'),
+    ('is_critical', 'business_value', operator.ge, 'CRITICAL_BUSINESS_VALUE'),
+    ('low_value', 'business_value', operator.le, 'LOW_BUSINESS_VALUE'),
+    ('very_poor_tech', 'tech_health', operator.le, 'VERY_POOR_TECH_HEALTH'),
+    ('poor_tech', 'tech_health', operator.le, 'POOR_TECH_HEALTH'),
+    ('fair_tech', 'tech_health', operator.ge, 'FAIR_TECH_HEALTH'),
+    ('good_tech', 'tech_health', operator.ge, 'GOOD_TECH_HEALTH'),
+    ('is_redundant', 'is_redundant', None, None),
+    ('high_strategic', 'strategic_fit', operator.ge, 'CRITICAL_BUSINESS_VALUE'),
+    ('below_low', 'composite_score', operator.lt, 'LOW_SCORE'),
+    ('at_least_low', 'composite_score', operator.ge, 'LOW_SCORE'),
+    ('below_medium', 'composite_score', operator.lt, 'MEDIUM_SCORE'),
+    ('at_least_medium', 'composite_score', operator.ge, 'MEDIUM_SCORE'),
+    ('at_least_high', 'composite_score', operator.ge, 'HIGH_SCORE'),
+)
+
+# Decision rules in order; the first whose condition holds applies:
+# (action, condition over the _RULE_COMPARISONS flags, rationale template
+# filled with the application's scores). The last rule is the default.
+# RecommendationEngine._classify checks the same rules one application at a time.
+_DECISION_RULES: List[Tuple[ActionType, Optional[Callable], str]] = [
+    (ActionType.IMMEDIATE_ACTION,
+     lambda c: c.poor_security & c.is_critical,
+     "Critical security risk (score: {security}/10) requires immediate remediation. "
+     "High business value makes this urgent."),
+    (ActionType.IMMEDIATE_ACTION,
+     lambda c: c.poor_security & c.very_poor_tech,
+     "Critical security risk (score: {security}/10) requires immediate remediation. "
+     "Poor technical health makes this urgent."),
+    (ActionType.RETIRE,
+     lambda c: c.below_low & ~c.is_critical & c.is_redundant,
+     "Low composite score ({composite_score}/100) with redundant functionality. "
+     "Consolidation opportunity to reduce costs (${cost:,.0f}/year)."),
+    (ActionType.RETIRE,
+     lambda c: c.below_low & ~c.is_critical & c.poor_tech & c.low_value,
+     "Low business value ({business_value}/10) and poor technical health ({tech_health}/10). "
+     "Decommissioning recommended to reduce technical debt."),
+    (ActionType.CONSOLIDATE,
+     lambda c: c.is_redundant & c.at_least_low,
+     "Redundant functionality identified. Consolidate with primary system to "
+     "eliminate duplication and save ${cost:,.0f}/year while preserving key features."),
+    (ActionType.INVEST,
+     lambda c: c.at_least_high & c.high_strategic & c.good_tech,
+     "Excellent composite score ({composite_score}/100) with high strategic alignment ({strategic_fit}/10). "
+     "Continue investment to maximize business value ({business_value}/10)."),
+    (ActionType.INVEST,
+     lambda c: c.at_least_high & c.high_strategic,
+     "High strategic value ({strategic_fit}/10) and business value ({business_value}/10). "
+     "Invest in technical improvements (current health: {tech_health}/10) to sustain long-term value."),
+    (ActionType.MIGRATE,
+     lambda c: c.is_critical & c.poor_tech,
+     "Critical business value ({business_value}/10) but poor technical health ({tech_health}/10). "
+     "Migration to modern platform recommended to reduce risk and improve maintainability."),
+    (ActionType.RETAIN,
+     lambda c: c.at_least_high,
+     "Strong composite score ({composite_score}/100) with balanced metrics. "
+     "Continue current operations with standard maintenance."),
+    (ActionType.MAINTAIN,
+     lambda c: c.at_least_medium & c.fair_tech,
+     "Good composite score ({composite_score}/100) and technical health ({tech_health}/10). "
+     "Maintain current state with routine updates and monitoring."),
+    (ActionType.TOLERATE,
+     lambda c: c.at_least_medium & ~c.at_least_high & c.is_critical,
+     "Critical business function ({business_value}/10) with moderate composite score ({composite_score}/100). "
+     "Accept current limitations while planning improvements."),
+    (ActionType.TOLERATE,
+     lambda c: c.at_least_medium,
+     "Moderate composite score ({composite_score}/100). Monitor for changes and "
+     "reassess during next planning cycle."),
+    (ActionType.MIGRATE,
+     lambda c: c.high_strategic & c.below_medium,
+     "High strategic fit ({strategic_fit}/10) but low composite score ({composite_score}/100). "
+     "Consider migration or modernization to realize strategic value."),
+    (ActionType.TOLERATE,
+     None,
+     "Composite score of {composite_score}/100 warrants monitoring. "
+     "Evaluate specific improvement opportunities during next review."),
+]
+
+# Rationale template fields, in _format_rationale argument order
+_RATIONALE_FIELDS = (
+    'composite_score', 'business_value', 'tech_health', 'security', 'strategic_fit', 'cost'
+)
+
+
+def _positional_template(template: str) -> str:
+    """Rewrite named template fields as positions in _RATIONALE_FIELDS."""
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is not None:
+            parts.append('{%d%s%s}' % (
+                _RATIONALE_FIELDS.index(field),
+                '!' + conversion if conversion else '',
+                ':' + spec if spec else ''
+            ))
+    return ''.join(parts)
+
+
+# Bound str.format of each rationale template, compiled once to positional
+# fields so formatting a row does not build a keyword dict
+_RATIONALE_FORMATTERS = tuple(
+    _positional_template(template).format for _, _, template in _DECISION_RULES
+)
+
+# Action value of each rule
+_RULE_ACTIONS = tuple(action.value for action, _, _ in _DECISION_RULES)
+
+# Actions and their values by code (ActionType definition order)
+_ACTION_TYPES: Tuple[ActionType, ...] = tuple(ActionType)
+_ACTION_CODES: Dict[ActionType, int] = {action: code for code, action in enumerate(_ACTION_TYPES)}
+_ACTION_VALUES: Tuple[str, ...] = tuple(action.value for action in _ACTION_TYPES)
+_ACTION_VALUE_ARRAY = np.array(_ACTION_VALUES, dtype=object)
+
+# Recommendation counts of a fresh engine
+_ZERO_COUNTS: Dict[str, int] = dict.fromkeys(_ACTION_VALUES, 0)
+
+# Action code of each rule
+_RULE_ACTION_CODES = np.array([action.code for action, _, _ in _DECISION_RULES], dtype=np.int8)
+
+# Application fields read by the decision logic, in generate_recommendation argument order
+_INPUT_COLUMNS = (
+    'Composite Score', 'Business Value', 'Tech Health', 'Security',
+    'Strategic Fit', 'Redundancy', 'Cost'
+)
+
+# Field types converted to float exactly as float()/int() would in the per-application path
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+# Actions prioritized lowest composite score first
+_LOWEST_SCORE_FIRST = (ActionType.RETIRE, ActionType.IMMEDIATE_ACTION)
+
+
+def _lowest_score_first(app: Dict) -> Tuple[float, float]:
+    """Priority key for retirement/remediation: lowest score, then highest business value."""
+    return (app.get('Composite Score', 0), -app.get('Business Value', 0))
+
+
+def _highest_score_first(app: Dict) -> Tuple[float, float]:
+    """Priority key for investment/retention: highest score, then highest business value."""
+    return (-app.get('Composite Score', 100), -app.get('Business Value', 0))
+
+
+def _select_rules(comparisons: SimpleNamespace) -> np.ndarray:
+    """
+    Index of the first _DECISION_RULES rule whose condition holds.
+
+    Args:
+        comparisons: Boolean array per _RULE_COMPARISONS name
+
+    Returns:
+        Rule index per element; np.select keeps the first matching condition
+    """
+    conditions = [condition(comparisons) for _, condition, _ in _DECISION_RULES[:-1]]
+    return np.select(conditions, np.arange(len(conditions)), default=len(conditions))
+
+
+# Rule index for every combination of the comparisons, keyed by their bits in
+# _RULE_COMPARISONS order; the comparisons themselves use the engine
+# thresholds, so the table does not depend on them
+_RULE_LOOKUP = _select_rules(SimpleNamespace(**{
+    name: (np.arange(1 << len(_RULE_COMPARISONS)) >> bit & 1).astype(bool)
+    for bit, (name, _, _, _) in enumerate(_RULE_COMPARISONS)
+})).astype(np.uint8)
+
+
+def _score_array(values: List) -> Optional[np.ndarray]:
+    """Scores as a numeric array, or None if they contain NaN or non-numeric values."""
+    scores = np.array(values)
+    if scores.dtype.kind == 'b':
+        return scores.astype(np.int64)
+    if scores.dtype.kind not in 'iuf' or (scores.dtype.kind == 'f' and np.isnan(scores).any()):
+        return None
+    return scores
+
 
 class RecommendationEngine:
     """
@@ -38,13 +231,17 @@ class RecommendationEngine:
 
     # Individual criteria thresholds
     CRITICAL_BUSINESS_VALUE = 8.0
+    LOW_BUSINESS_VALUE = 5.0
+    VERY_POOR_TECH_HEALTH = 3.0
     POOR_TECH_HEALTH = 4.0
+    FAIR_TECH_HEALTH = 6.0
+    GOOD_TECH_HEALTH = 7.0
     CRITICAL_SECURITY = 8.0
     POOR_SECURITY = 4.0
 
     def __init__(self):
         """Initialize the recommendation engine."""
-        self.recommendation_counts = {action.value: 0 for action in ActionType}
+        self.recommendation_counts = dict(_ZERO_COUNTS)
 
     def generate_recommendation(
         self,
@@ -54,8 +251,9 @@ class RecommendationEngine:
         security: float,
         strategic_fit: float,
         redundancy: int,
-        cost: float
-    ) -> Tuple[str, str]:
+        cost: float,
+        with_rationale: bool = True
+    ) -> Tuple[str, Optional[str]]:
         """
         Generate recommendation and rationale for a single application.
 
@@ -67,214 +265,376 @@ class RecommendationEngine:
             strategic_fit: Strategic fit score (0-10)
             redundancy: Redundancy indicator (0 or 1)
             cost: Annual cost
+            with_rationale: Format the rationale text (None is returned if False)
 
         Returns:
             Tuple of (action_recommendation, rationale_text)
         """
+        rule = self._rule_for_scores(
+            composite_score, business_value, tech_health, security, strategic_fit, redundancy
+        )
+        action = _RULE_ACTIONS[rule]
+        rationale = _RATIONALE_FORMATTERS[rule](
+            composite_score, business_value, tech_health, security, strategic_fit, cost
+        ) if with_rationale else None
+
+        # Track recommendation counts
+        self.recommendation_counts[action] += 1
+
+        return action, rationale
+
+    def _rule_for_scores(
+        self,
+        composite_score: float,
+        business_value: float,
+        tech_health: float,
+        security: float,
+        strategic_fit: float,
+        redundancy: int
+    ) -> int:
+        """Decision rule index for one application, without updating the counts."""
         # Critical flags
-        is_critical = business_value >= self.CRITICAL_BUSINESS_VALUE
+        critical_value = self.CRITICAL_BUSINESS_VALUE
+        is_critical = business_value >= critical_value
         poor_tech = tech_health <= self.POOR_TECH_HEALTH
         poor_security = security <= self.POOR_SECURITY
-        critical_security = security >= self.CRITICAL_SECURITY
         is_redundant = redundancy == 1
-        high_strategic = strategic_fit >= self.CRITICAL_BUSINESS_VALUE
+        high_strategic = strategic_fit >= critical_value
 
         # Decision logic
-        action, rationale = self._apply_decision_logic(
-            composite_score=composite_score,
-            is_critical=is_critical,
-            poor_tech=poor_tech,
-            poor_security=poor_security,
-            critical_security=critical_security,
-            is_redundant=is_redundant,
-            high_strategic=high_strategic,
-            business_value=business_value,
-            tech_health=tech_health,
-            security=security,
-            strategic_fit=strategic_fit,
-            cost=cost
+        return self._classify(
+            composite_score, is_critical, poor_tech, poor_security,
+            is_redundant, high_strategic, business_value, tech_health
         )
 
-        # Track recommendation counts
-        self.recommendation_counts[action] += 1
-
-        return action, rationale
-
-    def _apply_decision_logic(
+    def _classify(
         self,
         composite_score: float,
         is_critical: bool,
         poor_tech: bool,
         poor_security: bool,
-        critical_security: bool,
         is_redundant: bool,
         high_strategic: bool,
         business_value: float,
-        tech_health: float,
-        security: float,
-        strategic_fit: float,
-        cost: float
-    ) -> Tuple[str, str]:
+        tech_health: float
+    ) -> int:
         """
-        Apply decision matrix logic to determine recommendation.
+        Decision matrix without the rationale text.
+
+        Same outcome as checking the rules in _DECISION_RULES order, but the
+        rare IMMEDIATE ACTION/RETIRE/CONSOLIDATE checks sit behind a single
+        pre-filter and the common outcomes are split by score band.
 
         Returns:
-            Tuple of (action, rationale)
+            Index into _DECISION_RULES of the first rule that applies
         """
-        # IMMEDIATE ACTION: Security risk
-        if poor_security and (is_critical or tech_health <= 3):
-            return (
-                ActionType.IMMEDIATE_ACTION.value,
-                f"Critical security risk (score: {security}/10) requires immediate remediation. "
-                f"{'High business value' if is_critical else 'Poor technical health'} makes this urgent."
-            )
+        # Thresholds read more than once per call, as locals
+        low_score = self.LOW_SCORE
+        medium_score = self.MEDIUM_SCORE
 
-        # RETIRE: Low value, redundant, or obsolete
-        if composite_score < self.LOW_SCORE and not is_critical:
-            if is_redundant:
-                return (
-                    ActionType.RETIRE.value,
-                    f"Low composite score ({composite_score}/100) with redundant functionality. "
-                    f"Consolidation opportunity to reduce costs (${cost:,.0f}/year)."
-                )
-            elif poor_tech and business_value <= 5:
-                return (
-                    ActionType.RETIRE.value,
-                    f"Low business value ({business_value}/10) and poor technical health ({tech_health}/10). "
-                    f"Decommissioning recommended to reduce technical debt."
-                )
+        # Rare outcomes only apply to insecure, redundant or low-scoring applications
+        if poor_security or is_redundant or composite_score < low_score:
+            # IMMEDIATE ACTION: Security risk
+            if poor_security and (is_critical or tech_health <= self.VERY_POOR_TECH_HEALTH):
+                return 0 if is_critical else 1
 
-        # CONSOLIDATE: Redundant but with some value
-        if is_redundant and composite_score >= self.LOW_SCORE:
-            return (
-                ActionType.CONSOLIDATE.value,
-                f"Redundant functionality identified. Consolidate with primary system to "
-                f"eliminate duplication and save ${cost:,.0f}/year while preserving key features."
-            )
+            # RETIRE: Low value, redundant, or obsolete
+            if composite_score < low_score and not is_critical and (
+                    is_redundant or (poor_tech and business_value <= self.LOW_BUSINESS_VALUE)):
+                return 2 if is_redundant else 3
 
-        # INVEST: High value, strategic, good health
-        if composite_score >= self.HIGH_SCORE and high_strategic:
-            if tech_health >= 7:
-                return (
-                    ActionType.INVEST.value,
-                    f"Excellent composite score ({composite_score}/100) with high strategic alignment ({strategic_fit}/10). "
-                    f"Continue investment to maximize business value ({business_value}/10)."
-                )
+            # CONSOLIDATE: Redundant but with some value
+            if is_redundant and composite_score >= low_score:
+                return 4
+
+        if composite_score >= self.HIGH_SCORE:
+            # INVEST: High value, strategic, good health
+            if high_strategic:
+                rule = 5 if tech_health >= self.GOOD_TECH_HEALTH else 6
+
+            # MIGRATE: Good value but poor technical health
+            elif is_critical and poor_tech:
+                rule = 7
+
+            # RETAIN: High score overall
             else:
-                return (
-                    ActionType.INVEST.value,
-                    f"High strategic value ({strategic_fit}/10) and business value ({business_value}/10). "
-                    f"Invest in technical improvements (current health: {tech_health}/10) to sustain long-term value."
-                )
+                rule = 8
 
         # MIGRATE: Good value but poor technical health
-        if is_critical and poor_tech:
-            return (
-                ActionType.MIGRATE.value,
-                f"Critical business value ({business_value}/10) but poor technical health ({tech_health}/10). "
-                f"Migration to modern platform recommended to reduce risk and improve maintainability."
-            )
-
-        # RETAIN: High score overall
-        if composite_score >= self.HIGH_SCORE:
-            return (
-                ActionType.RETAIN.value,
-                f"Strong composite score ({composite_score}/100) with balanced metrics. "
-                f"Continue current operations with standard maintenance."
-            )
+        elif is_critical and poor_tech:
+            rule = 7
 
-        # MAINTAIN: Medium-high score with good tech health
-        if composite_score >= self.MEDIUM_SCORE and tech_health >= 6:
-            return (
-                ActionType.MAINTAIN.value,
-                f"Good composite score ({composite_score}/100) and technical health ({tech_health}/10). "
-                f"Maintain current state with routine updates and monitoring."
-            )
+        elif composite_score >= medium_score:
+            # MAINTAIN: Medium-high score with good tech health
+            if tech_health >= self.FAIR_TECH_HEALTH:
+                rule = 9
 
-        # TOLERATE: Medium score with issues but necessary
-        if self.MEDIUM_SCORE <= composite_score < self.HIGH_SCORE and is_critical:
-            return (
-                ActionType.TOLERATE.value,
-                f"Critical business function ({business_value}/10) with moderate composite score ({composite_score}/100). "
-                f"Accept current limitations while planning improvements."
-            )
+            # TOLERATE: Medium score with issues but necessary
+            elif is_critical:
+                rule = 10
 
-        # TOLERATE: Default for medium scores
-        if composite_score >= self.MEDIUM_SCORE:
-            return (
-                ActionType.TOLERATE.value,
-                f"Moderate composite score ({composite_score}/100). Monitor for changes and "
-                f"reassess during next planning cycle."
-            )
+            # TOLERATE: Default for medium scores
+            else:
+                rule = 11
 
         # MIGRATE: Low-medium score with strategic value
-        if high_strategic and composite_score < self.MEDIUM_SCORE:
-            return (
-                ActionType.MIGRATE.value,
-                f"High strategic fit ({strategic_fit}/10) but low composite score ({composite_score}/100). "
-                f"Consider migration or modernization to realize strategic value."
-            )
+        elif high_strategic and composite_score < medium_score:
+            rule = 12
 
         # Default: TOLERATE for edge cases
-        return (
-            ActionType.TOLERATE.value,
-            f"Composite score of {composite_score}/100 warrants monitoring. "
-            f"Evaluate specific improvement opportunities during next review."
+        else:
+            rule = 13
+
+        return rule
+
+    @staticmethod
+    def _format_rationale(
+        rule: int,
+        composite_score: float,
+        business_value: float,
+        tech_health: float,
+        security: float,
+        strategic_fit: float,
+        cost: float
+    ) -> str:
+        """Fill in the rationale template of a decision rule."""
+        return _RATIONALE_FORMATTERS[rule](
+            composite_score, business_value, tech_health, security, strategic_fit, cost
         )
 
+    def _classify_batch(
+        self,
+        composite_score: np.ndarray,
+        business_value: np.ndarray,
+        tech_health: np.ndarray,
+        security: np.ndarray,
+        strategic_fit: np.ndarray,
+        is_redundant: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized decision matrix: index into _DECISION_RULES for every application.
+
+        Packs the _RULE_COMPARISONS flags into a key for _RULE_LOOKUP.
+        """
+        scores = {
+            'composite_score': composite_score,
+            'business_value': business_value,
+            'tech_health': tech_health,
+            'security': security,
+            'strategic_fit': strategic_fit,
+            'is_redundant': is_redundant,
+        }
+
+        # Pack the comparisons into one key per application and look up its rule
+        key = np.zeros(len(composite_score), dtype=np.uint16)
+        for bit, (_, score, compare, threshold) in enumerate(_RULE_COMPARISONS):
+            flag = scores[score] if compare is None else compare(scores[score], getattr(self, threshold))
+            key |= flag.astype(np.uint16) << bit
+        return _RULE_LOOKUP[key]
+
     def batch_generate_recommendations(
         self,
-        applications: List[Dict]
+        applications: List[Dict],
+        generate_comments: bool = True,
+        copy: bool = True,
+        include_action_codes: bool = False
     ) -> List[Dict]:
         """
         Generate recommendations for multiple applications.
 
         Args:
             applications: List of application dictionaries with scores
+            generate_comments: Write the rationale into 'Comments'. When False,
+                only the actions are computed and 'Comments' is None.
+            copy: Return copies of the application dictionaries. When False,
+                the recommendation is written into the caller's dictionaries.
+                DataFrames are never modified in place.
+            include_action_codes: Also add 'Action Code', the ActionType.code of
+                the recommendation (an int8 column for DataFrames).
 
         Returns:
             List of applications with recommendations added
         """
         # Convert DataFrame to list of dicts if needed, but remember if it was a DataFrame
-        import pandas as pd
         was_dataframe = isinstance(applications, pd.DataFrame)
-        if was_dataframe:
-            applications = applications.to_dict('records')
-
-        results = []
 
-        for app in applications:
-            try:
-                action, rationale = self.generate_recommendation(
-                    composite_score=float(app.get('Composite Score', 0)),
-                    business_value=float(app.get('Business Value', 0)),
-                    tech_health=float(app.get('Tech Health', 0)),
-                    security=float(app.get('Security', 0)),
-                    strategic_fit=float(app.get('Strategic Fit', 0)),
-                    redundancy=int(app.get('Redundancy', 0)),
-                    cost=float(app.get('Cost', 0))
+        # Numeric inputs are classified in one vectorized pass
+        columns = self._extract_columns(applications)
+        if columns is not None:
+            if was_dataframe:
+                names = applications.get('Application Name')
+                codes, actions, comments = self._recommend_columns(
+                    columns,
+                    lambda i: names.iloc[i] if names is not None else 'Unknown',
+                    generate_comments
                 )
-
-                app_result = app.copy()
+                # Same shape as rebuilding the frame from records: RangeIndex, new columns last
+                new_columns = {'Action Recommendation': actions, 'Comments': comments}
+                if include_action_codes:
+                    new_columns['Action Code'] = codes
+                return applications.assign(**new_columns).reset_index(drop=True)
+
+            codes, actions, comments = self._recommend_columns(
+                columns,
+                lambda i: applications[i].get('Application Name', 'Unknown'),
+                generate_comments
+            )
+            results = []
+            for app, code, action, rationale in zip(applications, codes.tolist(), actions, comments):
+                app_result = app.copy() if copy else app
                 app_result['Action Recommendation'] = action
                 app_result['Comments'] = rationale
-
+                if include_action_codes:
+                    app_result['Action Code'] = code
                 results.append(app_result)
+            return results
 
-            except (ValueError, KeyError) as e:
-                logger.error(
-                    f"Error generating recommendation for {app.get('Application Name', 'Unknown')}: {e}"
-                )
-                app_result = app.copy()
-                app_result['Action Recommendation'] = ActionType.TOLERATE.value
-                app_result['Comments'] = "Unable to generate recommendation due to data issues."
-                results.append(app_result)
+        if was_dataframe:
+            applications = applications.to_dict('records')
+            # The records are private to this call
+            copy = False
+
+        results = []
+        # Rules of the recommended applications, counted once after the loop
+        rules = []
+
+        try:
+            for app in applications:
+                try:
+                    composite_score = float(app.get('Composite Score', 0))
+                    business_value = float(app.get('Business Value', 0))
+                    tech_health = float(app.get('Tech Health', 0))
+                    security = float(app.get('Security', 0))
+                    strategic_fit = float(app.get('Strategic Fit', 0))
+                    redundancy = int(app.get('Redundancy', 0))
+                    cost = float(app.get('Cost', 0))
+
+                    rule = self._rule_for_scores(
+                        composite_score, business_value, tech_health, security, strategic_fit, redundancy
+                    )
+                    rules.append(rule)
+
+                    app_result = app.copy() if copy else app
+                    app_result['Action Recommendation'] = _RULE_ACTIONS[rule]
+                    app_result['Comments'] = _RATIONALE_FORMATTERS[rule](
+                        composite_score, business_value, tech_health, security, strategic_fit, cost
+                    ) if generate_comments else None
+                    if include_action_codes:
+                        app_result['Action Code'] = _DECISION_RULES[rule][0].code
+
+                    results.append(app_result)
+
+                except (ValueError, KeyError) as e:
+                    logger.error(
+                        "Error generating recommendation for %s: %s",
+                        app.get('Application Name', 'Unknown'), e
+                    )
+                    app_result = app.copy() if copy else app
+                    app_result['Action Recommendation'] = ActionType.TOLERATE.value
+                    app_result['Comments'] = "Unable to generate recommendation due to data issues."
+                    if include_action_codes:
+                        app_result['Action Code'] = ActionType.TOLERATE.code
+                    results.append(app_result)
+        finally:
+            # Track recommendation counts, including the applications handled
+            # before an unexpected error
+            for rule, count in Counter(rules).items():
+                self.recommendation_counts[_RULE_ACTIONS[rule]] += count
 
         # Convert back to DataFrame if input was a DataFrame
         if was_dataframe:
             return pd.DataFrame(results)
         return results
 
+    def _extract_columns(self, applications) -> Optional[List[np.ndarray]]:
+        """
+        Decision inputs as float arrays in _INPUT_COLUMNS order (missing fields as 0).
+
+        Accepts a DataFrame or a list/tuple of application dictionaries.
+        Returns None if any input is not numeric or the redundancy flag is
+        infinite, in which case the per-application path handles the
+        conversion (and its errors).
+        """
+        columns = []
+        if isinstance(applications, pd.DataFrame):
+            for name in _INPUT_COLUMNS:
+                if name not in applications.columns:
+                    columns.append(np.zeros(len(applications)))
+                elif applications[name].dtype.kind in 'biuf':
+                    columns.append(applications[name].to_numpy(dtype=np.float64, na_value=np.nan))
+                else:
+                    return None
+        elif isinstance(applications, (list, tuple)):
+            for name in _INPUT_COLUMNS:
+                values = [app.get(name, 0) for app in applications]
+                if not all(issubclass(kind, _NUMERIC_TYPES) for kind in set(map(type, values))):
+                    return None
+                columns.append(np.fromiter(values, dtype=np.float64, count=len(values)))
+        else:
+            return None
+
+        if np.isinf(columns[_INPUT_COLUMNS.index('Redundancy')]).any():
+            return None
+        return columns
+
+    def _recommend_columns(
+        self,
+        columns: List[np.ndarray],
+        name_of: Callable[[int], str],
+        generate_comments: bool = True
+    ) -> Tuple[np.ndarray, List[str], List[Optional[str]]]:
+        """
+        Action codes, actions and comments for numeric decision inputs.
+
+        Args:
+            columns: Input arrays in _INPUT_COLUMNS order
+            name_of: Application name by position, used when logging data issues
+            generate_comments: Format the rationale (None comments if False)
+
+        Returns:
+            Tuple of (action codes array, actions list, comments list)
+        """
+        composite_score, business_value, tech_health, security, strategic_fit, redundancy, cost = columns
+
+        # The redundancy flag is read as an integer; a missing flag is a data issue
+        valid = np.isfinite(redundancy)
+        rules = self._classify_batch(
+            composite_score, business_value, tech_health, security, strategic_fit,
+            np.trunc(redundancy) == 1
+        )
+
+        action_codes = _RULE_ACTION_CODES[rules]
+        actions = _ACTION_VALUE_ARRAY[action_codes].tolist()
+        if generate_comments:
+            comments = [
+                _RATIONALE_FORMATTERS[rule](cs, bv, th, sec, sf, c)
+                for rule, cs, bv, th, sec, sf, c in zip(
+                    rules.tolist(), composite_score.tolist(), business_value.tolist(),
+                    tech_health.tolist(), security.tolist(), strategic_fit.tolist(), cost.tolist()
+                )
+            ]
+        else:
+            comments = [None] * len(rules)
+
+        # Track recommendation counts
+        counts = np.bincount(action_codes[valid], minlength=len(_ACTION_VALUES))
+        for action, count in zip(_ACTION_VALUES, counts.tolist()):
+            self.recommendation_counts[action] += count
+
+        if not valid.all():
+            action_codes[~valid] = ActionType.TOLERATE.code
+            log_errors = logger.isEnabledFor(logging.ERROR)
+            for i in np.flatnonzero(~valid).tolist():
+                if log_errors:
+                    logger.error(
+                        "Error generating recommendation for %s: cannot convert float NaN to integer",
+                        name_of(i)
+                    )
+                actions[i] = ActionType.TOLERATE.value
+                comments[i] = "Unable to generate recommendation due to data issues."
+
+        return action_codes, actions, comments
+
     def get_portfolio_summary(self) -> Dict:
         """
         Get summary statistics of recommendations generated.
@@ -287,18 +647,17 @@ class RecommendationEngine:
         if total == 0:
             return {"total": 0, "distribution": {}}
 
-        summary = {
+        # Python round() per action: for eight values it is cheaper than a NumPy
+        # round trip, and np.round rounds some halves differently
+        return {
             "total": total,
-            "distribution": {},
-            "percentages": {}
+            "distribution": dict(self.recommendation_counts),
+            "percentages": {
+                action: round((count / total) * 100, 1)
+                for action, count in self.recommendation_counts.items()
+            }
         }
 
-        for action, count in self.recommendation_counts.items():
-            summary["distribution"][action] = count
-            summary["percentages"][action] = round((count / total) * 100, 1)
-
-        return summary
-
     def prioritize_actions(
         self,
         applications: List[Dict],
@@ -314,33 +673,95 @@ class RecommendationEngine:
         Returns:
             Dictionary of action types with prioritized applications
         """
-        prioritized = {}
+        # Group by action in a single pass
+        buckets = defaultdict(list)
+        for app in applications:
+            buckets[app.get('Action Recommendation')].append(app)
 
-        # Group by action
-        for action in ActionType:
-            action_apps = [
-                app for app in applications
-                if app.get('Action Recommendation') == action.value
-            ]
+        prioritized = {}
+        for action, value in zip(_ACTION_TYPES, _ACTION_VALUES):
+            action_apps = buckets.get(value, [])
 
             # Sort by composite score (descending for positive actions, ascending for negative)
-            if action in [ActionType.RETIRE, ActionType.IMMEDIATE_ACTION]:
+            lowest_first = action in _LOWEST_SCORE_FIRST
+
+            # Numeric scores are ordered with a stable lexsort (same order as
+            # sorted()[:top_n]); NaN scores have no consistent order and other
+            # values compare as Python objects, so those buckets keep sorted()
+            top = None
+            if 0 <= top_n < len(action_apps):
+                default_score = 0 if lowest_first else 100
+                composite_score = _score_array([app.get('Composite Score', default_score) for app in action_apps])
+                business_value = _score_array([app.get('Business Value', 0) for app in action_apps])
+                if composite_score is not None and business_value is not None:
+                    top = np.lexsort((
+                        -business_value,
+                        composite_score if lowest_first else -composite_score
+                    ))[:top_n]
+
+            if top is not None:
+                prioritized[value] = [action_apps[i] for i in top.tolist()]
+            elif lowest_first:
                 # Lowest scores first for retirement/action
-                sorted_apps = sorted(
-                    action_apps,
-                    key=lambda x: (x.get('Composite Score', 0), -x.get('Business Value', 0))
-                )
+                prioritized[value] = sorted(action_apps, key=_lowest_score_first)[:top_n]
             else:
                 # Highest scores first for investment/retention
-                sorted_apps = sorted(
-                    action_apps,
-                    key=lambda x: (-x.get('Composite Score', 100), -x.get('Business Value', 0))
-                )
-
-            prioritized[action.value] = sorted_apps[:top_n]
+                prioritized[value] = sorted(action_apps, key=_highest_score_first)[:top_n]
 
         return prioritized
 
+    def prioritize_actions_df(
+        self,
+        df: pd.DataFrame,
+        top_n: int = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        DataFrame version of prioritize_actions.
+
+        Orders rows the same way (applications with a NaN score go last)
+        with one stable lexsort over the action, score and business value
+        columns instead of converting the rows to dictionaries. Rows are
+        grouped by the 'Action Code' column when present (see
+        batch_generate_recommendations), else by 'Action Recommendation'.
+
+        Args:
+            df: Applications with recommendations and numeric score columns
+            top_n: Number of top priority rows per action
+
+        Returns:
+            Dictionary of action values with the prioritized rows (original index kept)
+        """
+        def score_column(name: str) -> np.ndarray:
+            if name not in df.columns:
+                return np.zeros(len(df))
+            return df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Action codes in ActionType order; other values get -1
+        if 'Action Code' in df.columns:
+            codes = df['Action Code'].to_numpy()
+        elif 'Action Recommendation' in df.columns:
+            codes = pd.Categorical(df['Action Recommendation'], categories=_ACTION_VALUES).codes
+        else:
+            codes = np.full(len(df), -1, dtype=np.int8)
+
+        composite_score = score_column('Composite Score')
+        business_value = score_column('Business Value')
+        lowest_first = np.isin(codes, [action.code for action in _LOWEST_SCORE_FIRST])
+
+        # Grouped by action, then by priority; lexsort is stable, so ties keep row order
+        order = np.lexsort((
+            -business_value,
+            np.where(lowest_first, composite_score, -composite_score),
+            codes
+        ))
+        bounds = np.searchsorted(codes[order], np.arange(len(_ACTION_VALUES) + 1))
+
+        return {
+            value: df.iloc[order[bounds[code]:bounds[code + 1]][:top_n]]
+            for code, value in enumerate(_ACTION_VALUES)
+        }
+
     def reset_counts(self):
         """Reset recommendation counts for new analysis."""
-        self.recommendation_counts = {action.value: 0 for action in ActionType}
+        # In place: the counts always hold exactly the ActionType values
+        self.recommendation_counts.update(_ZERO_COUNTS)
@@ -5,8 +5,9 @@ Multi-format report generation (PDF, Excel, PowerPoint) with executive summaries
 
 import pandas as pd
 import numpy as np
+import functools
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import json
 from io import BytesIO
 import smtplib
@@ -46,13 +47,86 @@ except ImportError:
 # Enhanced Excel with Charts
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.chart import BarChart, PieChart, LineChart, Reference
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils.dataframe import dataframe_to_rows
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
     OPENPYXL_CHARTS_AVAILABLE = True
 except ImportError:
     OPENPYXL_CHARTS_AVAILABLE = False
 
+# Streaming Excel writer with chart support
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Fast JSON export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Columnar export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from .array_utils import frame_snapshot
+
+# TIME framework categories by code: bit 0 = healthy (> 5), bit 1 = valuable (> 6)
+_TIME_CATEGORIES = ('Eliminate', 'Tolerate', 'Migrate', 'Invest')
+
+# Health and value bands by upper bound; the last health band is a perfect 10 only
+_HEALTH_BANDS = ('Critical (1-3)', 'Poor (4-5)', 'Fair (6-7)', 'Good (8-9)', 'Excellent (10)')
+_HEALTH_BAND_EDGES = (3, 5, 7, 9)
+_VALUE_BANDS = ('Low Value (1-3)', 'Medium Value (4-6)', 'High Value (7-10)')
+_VALUE_BAND_EDGES = (3, 6)
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values orjson cannot encode, matching json.dumps(default=str)"""
+    if isinstance(value, float):
+        # NumPy float scalars are written as numbers, as the stdlib encoder does
+        return float(value)
+    return str(value)
+
+
+def _to_json(data: Any, indent: bool = True) -> str:
+    """
+    Serialize report data like json.dumps(default=str), with orjson when available.
+
+    Datetimes go through the str() fallback and non-string keys are written
+    as strings, as with the stdlib encoder; NaN is written as null.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=_json_default).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, default=str)
+
+
+def _cached_section(method: Callable) -> Callable:
+    """
+    Memoize a section generator per instance and arguments.
+
+    Reports share sections (overview, recommendations, ...), so each is
+    computed once and every call returns the same object. Treat it as
+    read-only; copy it before modifying.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._sections:
+            self._sections[key] = method(self, *args, **kwargs)
+        return self._sections[key]
+    return wrapper
+
 
 class AdvancedReportGenerator:
     """Generate comprehensive reports in multiple formats"""
@@ -87,85 +161,179 @@ class AdvancedReportGenerator:
 
     def __init__(self, df_applications: pd.DataFrame):
         """Initialize with application portfolio data"""
-        self.df = df_applications.copy()
+        # Snapshot the portfolio so the cached sections don't see later edits
+        # by the caller; column buffers are shared when Copy-on-Write is on
+        self.df = frame_snapshot(df_applications)
         self.report_data = {}
         self.generated_at = datetime.now()
 
+        # Column arrays and derived statistics computed on first use and
+        # shared by every section
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._stats: Dict[str, Any] = {}
+        self._sections: Dict[tuple, Any] = {}
+
+    def _array(self, column: str) -> np.ndarray:
+        """NumPy array of a portfolio column, cached until invalidate()"""
+        values = self._arrays.get(column)
+        if values is None:
+            values = self._arrays[column] = self.df[column].to_numpy()
+        return values
+
+    def _records(self, positions: np.ndarray, columns: List[str]) -> List[Dict[str, Any]]:
+        """Rows at the given positions as plain-Python dicts, like to_dict('records')"""
+        values = [self._array(column)[positions].tolist() for column in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    def _stat(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Derived portfolio statistic, computed once until invalidate()"""
+        if name not in self._stats:
+            self._stats[name] = compute()
+        return self._stats[name]
+
+    def invalidate(self):
+        """Drop cached arrays, statistics and sections after self.df changes"""
+        self._arrays.clear()
+        self._stats.clear()
+        self._sections.clear()
+
+    def _health_bands(self) -> np.ndarray:
+        """Health band code per application; len(_HEALTH_BANDS) means no band"""
+        return self._stat('score_bands', self._compute_score_bands)[0]
+
+    def _value_bands(self) -> np.ndarray:
+        """Business value band code per application; len(_VALUE_BANDS) means no band"""
+        return self._stat('score_bands', self._compute_score_bands)[1]
+
+    def _compute_score_bands(self) -> tuple:
+        health = self._array('Tech Health')
+        value = self._array('Business Value')
+
+        # One byte per code keeps the counting and stable sorts cheap
+        health_bands = np.searchsorted(_HEALTH_BAND_EDGES, health).astype(np.uint8)
+        # Scores between 9 and 10 (or missing) fall outside every band
+        health_bands[(health_bands == len(_HEALTH_BAND_EDGES)) & (health != 10)] = len(_HEALTH_BANDS)
+
+        value_bands = np.searchsorted(_VALUE_BAND_EDGES, value).astype(np.uint8)
+        value_bands[(value_bands == len(_VALUE_BAND_EDGES)) & ~(value > _VALUE_BAND_EDGES[-1])] = len(_VALUE_BANDS)
+        return health_bands, value_bands
+
+    def _total_cost(self):
+        """Total annual portfolio cost"""
+        return self._stat('cost_sum', self.df['Cost'].sum)
+
+    def _category_groups(self):
+        """Portfolio grouped by category, shared by the per-category breakdowns"""
+        return self._stat('category_groups', lambda: self.df.groupby('Category'))
+
+    def _category_stats(self) -> pd.DataFrame:
+        """
+        Per-category aggregates in one grouped pass, shared by the overview,
+        cost breakdown and technical sections.
+        """
+        return self._stat('category_stats', lambda: self._category_groups().agg(
+            app_count=('Application Name', 'count'),
+            cost=('Cost', 'sum'),
+            health_mean=('Tech Health', 'mean'),
+            health_min=('Tech Health', 'min'),
+            health_max=('Tech Health', 'max'),
+            health_count=('Tech Health', 'count'),
+            value_mean=('Business Value', 'mean'),
+        ))
+
+    def _category_breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """Application count, total cost and average health/value per category"""
+        stats = self._category_stats()[['app_count', 'cost', 'health_mean', 'value_mean']]
+        stats.columns = ['Application Name', 'Cost', 'Tech Health', 'Business Value']
+        return stats.round(2).to_dict('index')
+
+    def _category_health_stats(self) -> Dict[tuple, Dict[str, Any]]:
+        """Mean/min/max/count of Tech Health per category, keyed like a groupby agg"""
+        stats = self._category_stats()
+        return {
+            ('Tech Health', stat): stats[f'health_{stat}'].round(2).to_dict()
+            for stat in ('mean', 'min', 'max', 'count')
+        }
+
     def generate_portfolio_overview(self) -> Dict[str, Any]:
         """Generate high-level portfolio overview"""
+        overview = self._portfolio_overview()
+
+        # The report date is current on every call; the rest is cached
+        return {
+            **overview,
+            'summary': {
+                **overview['summary'],
+                'report_date': self.generated_at.strftime('%Y-%m-%d %H:%M:%S')
+            }
+        }
+
+    @_cached_section
+    def _portfolio_overview(self) -> Dict[str, Any]:
+        """Portfolio overview without the report date"""
 
         total_apps = len(self.df)
-        total_cost = self.df['Cost'].sum()
+        total_cost = self._total_cost()
         avg_health = self.df['Tech Health'].mean()
         avg_value = self.df['Business Value'].mean()
 
         # Category breakdown
-        category_stats = self.df.groupby('Category').agg({
-            'Application Name': 'count',
-            'Cost': 'sum',
-            'Tech Health': 'mean',
-            'Business Value': 'mean'
-        }).round(2)
-
-        # Health distribution
-        health_distribution = {
-            'Critical (1-3)': len(self.df[self.df['Tech Health'] <= 3]),
-            'Poor (4-5)': len(self.df[(self.df['Tech Health'] > 3) & (self.df['Tech Health'] <= 5)]),
-            'Fair (6-7)': len(self.df[(self.df['Tech Health'] > 5) & (self.df['Tech Health'] <= 7)]),
-            'Good (8-9)': len(self.df[(self.df['Tech Health'] > 7) & (self.df['Tech Health'] <= 9)]),
-            'Excellent (10)': len(self.df[self.df['Tech Health'] == 10])
-        }
+        category_breakdown = self._category_breakdown()
 
-        # Value distribution
-        value_distribution = {
-            'Low Value (1-3)': len(self.df[self.df['Business Value'] <= 3]),
-            'Medium Value (4-6)': len(self.df[(self.df['Business Value'] > 3) & (self.df['Business Value'] <= 6)]),
-            'High Value (7-10)': len(self.df[self.df['Business Value'] > 6])
-        }
+        # Health and value distributions, one band lookup per column
+        health_counts = np.bincount(self._health_bands(), minlength=len(_HEALTH_BANDS) + 1).tolist()
+        health_distribution = dict(zip(_HEALTH_BANDS, health_counts))
+
+        value_counts = np.bincount(self._value_bands(), minlength=len(_VALUE_BANDS) + 1).tolist()
+        value_distribution = dict(zip(_VALUE_BANDS, value_counts))
 
         return {
             'summary': {
                 'total_applications': total_apps,
                 'total_annual_cost': total_cost,
                 'average_health_score': round(avg_health, 2),
-                'average_business_value': round(avg_value, 2),
-                'report_date': self.generated_at.strftime('%Y-%m-%d %H:%M:%S')
+                'average_business_value': round(avg_value, 2)
             },
-            'category_breakdown': category_stats.to_dict('index'),
+            'category_breakdown': category_breakdown,
             'health_distribution': health_distribution,
             'value_distribution': value_distribution
         }
 
+    @_cached_section
     def generate_key_metrics(self) -> Dict[str, Any]:
         """Generate key performance metrics"""
 
         # TIME Framework distribution
-        time_distribution = {}
-        for idx, row in self.df.iterrows():
-            health = row['Tech Health']
-            value = row['Business Value']
-
-            if health <= 5 and value <= 6:
-                category = 'Eliminate'
-            elif health > 5 and value <= 6:
-                category = 'Tolerate'
-            elif health <= 5 and value > 6:
-                category = 'Migrate'
-            else:
-                category = 'Invest'
-
-            time_distribution[category] = time_distribution.get(category, 0) + 1
+        health = self._array('Tech Health')
+        value = self._array('Business Value')
+        low_health = health <= 5
+        low_value = value <= 6
+
+        # Quadrant codes index _TIME_CATEGORIES; the three quadrant tests are
+        # disjoint, and missing scores fail all of them and stay at Invest
+        codes = np.full(health.shape, 3, dtype=np.uint8)
+        codes -= (low_health & low_value).view(np.uint8) * np.uint8(3)
+        codes -= ((health > 5) & low_value).view(np.uint8) * np.uint8(2)
+        codes -= (low_health & (value > 6)).view(np.uint8)
+        counts = np.bincount(codes, minlength=len(_TIME_CATEGORIES)).tolist()
+
+        # Categories in order of first appearance, like the per-row tally;
+        # argmax stops at the first matching row instead of sorting the codes
+        first_rows = sorted(
+            (int(np.argmax(codes == code)), code)
+            for code, count in enumerate(counts) if count
+        )
+        time_distribution = {_TIME_CATEGORIES[code]: counts[code] for _, code in first_rows}
 
         # Cost efficiency
-        high_cost_low_value = len(self.df[(self.df['Cost'] > self.df['Cost'].median()) &
-                                           (self.df['Business Value'] <= 5)])
-
-        low_cost_high_value = len(self.df[(self.df['Cost'] < self.df['Cost'].median()) &
-                                           (self.df['Business Value'] >= 7)])
+        cost = self._array('Cost')
+        cost_median = self._stat('cost_median', self.df['Cost'].median)
+        high_cost_low_value = int(np.count_nonzero((cost > cost_median) & (value <= 5)))
+        low_cost_high_value = int(np.count_nonzero((cost < cost_median) & (value >= 7)))
 
         # Technical debt estimate (apps with health < 5)
-        technical_debt_apps = self.df[self.df['Tech Health'] < 5]
-        technical_debt_cost = technical_debt_apps['Cost'].sum()
+        technical_debt_apps = np.flatnonzero(health < 5)
+        technical_debt_cost = np.nansum(cost[technical_debt_apps])
 
         return {
             'time_framework': time_distribution,
@@ -181,133 +349,146 @@ class AdvancedReportGenerator:
             }
         }
 
+    @_cached_section
     def generate_top_risks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Identify top risk applications"""
 
-        risks = []
-
-        for idx, row in self.df.iterrows():
-            app_name = row['Application Name']
-            health = row['Tech Health']
-            value = row['Business Value']
-            cost = row['Cost']
-
-            # Calculate risk score
-            health_risk = (10 - health) * 10
-            criticality = value * 10
-            cost_exposure = min(100, (cost / 500000) * 100)
-
-            risk_score = (health_risk * 0.4 + criticality * 0.35 + cost_exposure * 0.25)
+        names = self._array('Application Name')
+        health = self._array('Tech Health')
+        value = self._array('Business Value')
+        cost = self._array('Cost')
+
+        # Calculate risk scores for the whole portfolio at once
+        health_risk = (10 - health) * 10
+        criticality = value * 10
+        cost_ratio = (cost / 500000) * 100
+        # Same result as min(100, ratio), which also caps missing costs at 100
+        cost_exposure = np.where(cost_ratio < 100, cost_ratio, 100)
+
+        risk_scores = health_risk * 0.4 + criticality * 0.35 + cost_exposure * 0.25
+
+        # Scores are rounded as Python floats and ranked highest first; ties
+        # keep their row order
+        rounded = pd.Series([round(score, 1) for score in np.asarray(risk_scores, dtype=np.float64).tolist()])
+        if limit < 0 or rounded.isna().any():
+            # Sorting with NaN keys or a negative slice needs the full ranking
+            positions = sorted(range(len(rounded)), key=rounded.tolist().__getitem__, reverse=True)[:limit]
+        else:
+            positions = rounded.nlargest(limit).index.tolist()
+        rounded = rounded[positions].tolist()
 
-            # Risk factors
+        # Risk factors only for the applications that made the cut
+        picked = np.asarray(positions, dtype=np.intp)
+        risks = []
+        for risk_score, app_name, app_health, app_value, app_cost in zip(
+                rounded, names[picked].tolist(), health[picked].tolist(),
+                value[picked].tolist(), cost[picked].tolist()):
             risk_factors = []
-            if health <= 3:
+            if app_health <= 3:
                 risk_factors.append('Critical technical health')
-            if value >= 8:
+            if app_value >= 8:
                 risk_factors.append('Mission-critical application')
-            if cost > 200000:
+            if app_cost > 200000:
                 risk_factors.append('High cost exposure')
 
             risks.append({
                 'app_name': app_name,
-                'risk_score': round(risk_score, 1),
-                'health': health,
-                'business_value': value,
-                'annual_cost': cost,
+                'risk_score': risk_score,
+                'health': app_health,
+                'business_value': app_value,
+                'annual_cost': app_cost,
                 'risk_factors': risk_factors
             })
 
-        # Sort by risk score
-        risks.sort(key=lambda x: x['risk_score'], reverse=True)
-
-        return risks[:limit]
+        return risks
 
+    @_cached_section
     def generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generate actionable recommendations"""
 
         recommendations = []
+        names = self._array('Application Name')
+        health = self._array('Tech Health')
+        value = self._array('Business Value')
+        cost = self._array('Cost')
 
         # 1. Retirement candidates
-        retire_candidates = self.df[(self.df['Tech Health'] <= 3) & (self.df['Business Value'] <= 4)]
+        retire_candidates = np.flatnonzero((health <= 3) & (value <= 4))
         if len(retire_candidates) > 0:
             recommendations.append({
                 'priority': 'high',
                 'category': 'Rationalization',
                 'action': 'Retire low-value, unhealthy applications',
                 'impact': f'{len(retire_candidates)} applications identified',
-                'estimated_savings': retire_candidates['Cost'].sum(),
+                'estimated_savings': np.nansum(cost[retire_candidates]),
                 'timeline': '6-12 months',
-                'details': f'Applications: {", ".join(retire_candidates["Application Name"].head(5).tolist())}'
+                'details': f'Applications: {", ".join(names[retire_candidates[:5]].tolist())}'
             })
 
         # 2. Modernization priorities
-        modernize_candidates = self.df[(self.df['Tech Health'] <= 5) & (self.df['Business Value'] >= 7)]
+        modernize_candidates = np.flatnonzero((health <= 5) & (value >= 7))
         if len(modernize_candidates) > 0:
             recommendations.append({
                 'priority': 'urgent',
                 'category': 'Modernization',
                 'action': 'Modernize critical applications with poor health',
                 'impact': f'{len(modernize_candidates)} critical applications at risk',
-                'estimated_savings': modernize_candidates['Cost'].sum() * 0.2,
+                'estimated_savings': np.nansum(cost[modernize_candidates]) * 0.2,
                 'timeline': '3-6 months',
-                'details': f'Applications: {", ".join(modernize_candidates["Application Name"].head(5).tolist())}'
+                'details': f'Applications: {", ".join(names[modernize_candidates[:5]].tolist())}'
             })
 
         # 3. Cost optimization
-        high_cost_apps = self.df[self.df['Cost'] > self.df['Cost'].quantile(0.75)]
+        high_cost_apps = np.flatnonzero(cost > self._stat('cost_q75', lambda: self.df['Cost'].quantile(0.75)))
         if len(high_cost_apps) > 0:
+            high_cost_total = np.nansum(cost[high_cost_apps])
             recommendations.append({
                 'priority': 'medium',
                 'category': 'Cost Optimization',
                 'action': 'Review and optimize high-cost applications',
                 'impact': f'Top 25% of applications by cost',
-                'estimated_savings': high_cost_apps['Cost'].sum() * 0.15,
+                'estimated_savings': high_cost_total * 0.15,
                 'timeline': '3-9 months',
-                'details': f'{len(high_cost_apps)} applications consuming {(high_cost_apps["Cost"].sum() / self.df["Cost"].sum() * 100):.1f}% of budget'
+                'details': f'{len(high_cost_apps)} applications consuming {(high_cost_total / self._total_cost() * 100):.1f}% of budget'
             })
 
         # 4. Consolidation opportunities
         category_counts = self.df['Category'].value_counts()
-        overlapping_categories = category_counts[category_counts > 5]
+        overlapping_categories = category_counts[category_counts > 5].index.tolist()
         if len(overlapping_categories) > 0:
             recommendations.append({
                 'priority': 'medium',
                 'category': 'Consolidation',
                 'action': 'Consolidate redundant applications in overlapping categories',
                 'impact': f'{len(overlapping_categories)} categories with 5+ applications',
-                'estimated_savings': self.df['Cost'].sum() * 0.10,
+                'estimated_savings': self._total_cost() * 0.10,
                 'timeline': '6-18 months',
-                'details': f'Categories: {", ".join(overlapping_categories.head(3).index.tolist())}'
+                'details': f'Categories: {", ".join(overlapping_categories[:3])}'
             })
 
         return recommendations
 
+    @_cached_section
     def generate_cost_breakdown(self) -> Dict[str, Any]:
         """Generate detailed cost breakdown"""
 
-        total_cost = self.df['Cost'].sum()
+        total_cost = self._total_cost()
 
-        # By category
-        category_costs = self.df.groupby('Category')['Cost'].sum().sort_values(ascending=False)
+        # By category, reusing the totals shared with the overview
+        category_costs = self._category_stats()['cost'].sort_values(ascending=False)
 
-        # By health tier
-        health_tiers = {
-            'Critical (1-3)': self.df[self.df['Tech Health'] <= 3]['Cost'].sum(),
-            'Poor (4-5)': self.df[(self.df['Tech Health'] > 3) & (self.df['Tech Health'] <= 5)]['Cost'].sum(),
-            'Fair (6-7)': self.df[(self.df['Tech Health'] > 5) & (self.df['Tech Health'] <= 7)]['Cost'].sum(),
-            'Good (8-9)': self.df[(self.df['Tech Health'] > 7) & (self.df['Tech Health'] <= 9)]['Cost'].sum(),
-            'Excellent (10)': self.df[self.df['Tech Health'] == 10]['Cost'].sum()
-        }
-
-        # By value tier
-        value_tiers = {
-            'Low Value (1-3)': self.df[self.df['Business Value'] <= 3]['Cost'].sum(),
-            'Medium Value (4-6)': self.df[(self.df['Business Value'] > 3) & (self.df['Business Value'] <= 6)]['Cost'].sum(),
-            'High Value (7-10)': self.df[self.df['Business Value'] > 6]['Cost'].sum()
-        }
+        # By health and value tier, masking Cost with the cached band codes
+        # (a grouped sum would change totals in the last digits)
+        cost = self.df['Cost']
+        health_bands = self._health_bands()
+        health_tiers = {band: cost[health_bands == code].sum() for code, band in enumerate(_HEALTH_BANDS)}
+        value_bands = self._value_bands()
+        value_tiers = {band: cost[value_bands == code].sum() for code, band in enumerate(_VALUE_BANDS)}
 
         # Top 10 most expensive
-        top_10_expensive = self.df.nlargest(10, 'Cost')[['Application Name', 'Cost', 'Tech Health', 'Business Value']].to_dict('records')
+        top_10_expensive = self.df.nlargest(10, 'Cost')[
+            ['Application Name', 'Cost', 'Tech Health', 'Business Value']
+        ].to_dict('records')
 
         return {
             'total_annual_cost': total_cost,
@@ -353,18 +534,13 @@ class AdvancedReportGenerator:
         """Generate technical deep dive report"""
 
         # Technical health analysis
-        health_stats = self.df.groupby('Category').agg({
-            'Tech Health': ['mean', 'min', 'max', 'count']
-        }).round(2)
+        health_stats = self._category_health_stats()
 
-        # Apps needing attention
-        critical_apps = self.df[self.df['Tech Health'] <= 3][
-            ['Application Name', 'Tech Health', 'Business Value', 'Cost', 'Category']
-        ].to_dict('records')
-
-        poor_apps = self.df[(self.df['Tech Health'] > 3) & (self.df['Tech Health'] <= 5)][
-            ['Application Name', 'Tech Health', 'Business Value', 'Cost', 'Category']
-        ].to_dict('records')
+        # Apps needing attention: the Critical (1-3) and Poor (4-5) health bands
+        columns = ['Application Name', 'Tech Health', 'Business Value', 'Cost', 'Category']
+        health_bands = self._health_bands()
+        critical_apps = self._records(np.flatnonzero(health_bands == 0), columns)
+        poor_apps = self._records(np.flatnonzero(health_bands == 1), columns)
 
         return {
             'report_type': 'technical_deep_dive',
@@ -372,7 +548,7 @@ class AdvancedReportGenerator:
             'generated_at': self.generated_at.isoformat(),
             'sections': {
                 'portfolio_overview': self.generate_portfolio_overview(),
-                'health_statistics': health_stats.to_dict(),
+                'health_statistics': health_stats,
                 'critical_applications': critical_apps,
                 'poor_health_applications': poor_apps,
                 'recommendations': [r for r in self.generate_recommendations()
@@ -382,53 +558,86 @@ class AdvancedReportGenerator:
 
     def export_to_json(self, report_data: Dict[str, Any]) -> str:
         """Export report to JSON format"""
-        return json.dumps(report_data, indent=2, default=str)
+        return _to_json(report_data)
+
+    def export_to_parquet(self, report_data: Dict[str, Any]) -> BytesIO:
+        """
+        Export the portfolio and report to a single Parquet file.
+
+        The full portfolio is stored as the (dictionary-encoded, Snappy
+        compressed) table; the report sections travel as JSON in the file's
+        key-value metadata under b'report'.
+        """
+
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet export. Install with: pip install pyarrow")
+
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b'report': _to_json(report_data, indent=False).encode('utf-8')
+        })
+
+        output = BytesIO()
+        pq.write_table(table, output, compression='snappy', use_dictionary=True, write_statistics=True)
+        output.seek(0)
+        return output
 
     def export_to_excel(self, report_data: Dict[str, Any]) -> BytesIO:
         """Export report to Excel format with multiple sheets and embedded charts"""
 
+        if XLSXWRITER_AVAILABLE:
+            return self._export_to_excel_streaming(report_data)
+
         output = BytesIO()
 
         if OPENPYXL_CHARTS_AVAILABLE:
-            # Use openpyxl directly for chart support
-            wb = Workbook()
-            wb.remove(wb.active)  # Remove default sheet
+            # Use openpyxl directly for chart support; write-only sheets stream
+            # rows to the file instead of keeping a Cell object per value
+            wb = Workbook(write_only=True)
 
             # 1. Summary Sheet with formatting
             ws_summary = wb.create_sheet("Summary", 0)
             summary = report_data['sections']['portfolio_overview']['summary']
 
-            # Header styling
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True, size=12)
+            # Header styling, registered once and applied by name
+            wb.add_named_style(NamedStyle(
+                name='report_header',
+                font=Font(color="FFFFFF", bold=True, size=12),
+                fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+            ))
+
+            def styled(ws, value, font: Font = None, style: str = None) -> WriteOnlyCell:
+                """Write-only cell with its own font or a registered named style"""
+                cell = WriteOnlyCell(ws, value=value)
+                if style is not None:
+                    cell.style = style
+                if font is not None:
+                    cell.font = font
+                return cell
+
+            def write_table(ws, rows) -> None:
+                """Stream rows into an empty sheet with a styled header row"""
+                rows = iter(rows)
+                ws.append([styled(ws, value, style='report_header') for value in next(rows)])
+                for row in rows:
+                    ws.append(row)
 
             # Write summary data with formatting
-            ws_summary['A1'] = "Application Portfolio Summary"
-            ws_summary['A1'].font = Font(bold=True, size=16)
-            ws_summary.merge_cells('A1:B1')
+            ws_summary.append([styled(ws_summary, "Application Portfolio Summary", Font(bold=True, size=16))])
+            ws_summary.merged_cells.add('A1:B1')
+            ws_summary.append([])
 
-            row = 3
             for key, value in summary.items():
-                ws_summary[f'A{row}'] = key.replace('_', ' ').title()
-                ws_summary[f'B{row}'] = value
-                ws_summary[f'A{row}'].font = Font(bold=True)
-                row += 1
+                ws_summary.append([styled(ws_summary, key.replace('_', ' ').title(), Font(bold=True)), value])
 
             # 2. Category Breakdown with Bar Chart
             if 'category_breakdown' in report_data['sections']['portfolio_overview']:
                 ws_cat = wb.create_sheet("Category Breakdown")
-                df_categories = pd.DataFrame.from_dict(
-                    report_data['sections']['portfolio_overview']['category_breakdown'],
-                    orient='index'
-                )
+                category_breakdown = report_data['sections']['portfolio_overview']['category_breakdown']
 
                 # Write data
-                for r_idx, row in enumerate(dataframe_to_rows(df_categories, index=True, header=True), 1):
-                    for c_idx, value in enumerate(row, 1):
-                        cell = ws_cat.cell(row=r_idx, column=c_idx, value=value)
-                        if r_idx == 1:
-                            cell.font = header_font
-                            cell.fill = header_fill
+                write_table(ws_cat, self._excel_record_rows(category_breakdown, index=True))
 
                 # Add bar chart for cost by category
                 chart = BarChart()
@@ -436,8 +645,8 @@ class AdvancedReportGenerator:
                 chart.x_axis.title = "Category"
                 chart.y_axis.title = "Annual Cost ($)"
 
-                data = Reference(ws_cat, min_col=3, min_row=1, max_row=len(df_categories)+1)
-                cats = Reference(ws_cat, min_col=1, min_row=2, max_row=len(df_categories)+1)
+                data = Reference(ws_cat, min_col=3, min_row=1, max_row=len(category_breakdown)+1)
+                cats = Reference(ws_cat, min_col=1, min_row=2, max_row=len(category_breakdown)+1)
                 chart.add_data(data, titles_from_data=True)
                 chart.set_categories(cats)
                 chart.height = 10
@@ -448,23 +657,12 @@ class AdvancedReportGenerator:
             ws_health = wb.create_sheet("Health Distribution")
             health_dist = report_data['sections']['portfolio_overview']['health_distribution']
 
-            ws_health['A1'] = "Health Level"
-            ws_health['B1'] = "Count"
-            ws_health['A1'].font = header_font
-            ws_health['B1'].font = header_font
-            ws_health['A1'].fill = header_fill
-            ws_health['B1'].fill = header_fill
-
-            row = 2
-            for level, count in health_dist.items():
-                ws_health[f'A{row}'] = level
-                ws_health[f'B{row}'] = count
-                row += 1
+            write_table(ws_health, [["Health Level", "Count"], *health_dist.items()])
 
             # Add pie chart
             pie = PieChart()
-            labels = Reference(ws_health, min_col=1, min_row=2, max_row=row-1)
-            data = Reference(ws_health, min_col=2, min_row=1, max_row=row-1)
+            labels = Reference(ws_health, min_col=1, min_row=2, max_row=len(health_dist)+1)
+            data = Reference(ws_health, min_col=2, min_row=1, max_row=len(health_dist)+1)
             pie.add_data(data, titles_from_data=True)
             pie.set_categories(labels)
             pie.title = "Application Health Distribution"
@@ -475,40 +673,19 @@ class AdvancedReportGenerator:
             # 4. Top Risks
             if 'top_risks' in report_data['sections']:
                 ws_risks = wb.create_sheet("Top Risks")
-                df_risks = pd.DataFrame(report_data['sections']['top_risks'])
-
-                for r_idx, row in enumerate(dataframe_to_rows(df_risks, index=False, header=True), 1):
-                    for c_idx, value in enumerate(row, 1):
-                        cell = ws_risks.cell(row=r_idx, column=c_idx, value=value)
-                        if r_idx == 1:
-                            cell.font = header_font
-                            cell.fill = header_fill
+                write_table(ws_risks, self._excel_record_rows(report_data['sections']['top_risks']))
 
             # 5. Recommendations
             if 'recommendations' in report_data['sections']:
                 ws_rec = wb.create_sheet("Recommendations")
-                df_recommendations = pd.DataFrame(report_data['sections']['recommendations'])
-
-                for r_idx, row in enumerate(dataframe_to_rows(df_recommendations, index=False, header=True), 1):
-                    for c_idx, value in enumerate(row, 1):
-                        cell = ws_rec.cell(row=r_idx, column=c_idx, value=value)
-                        if r_idx == 1:
-                            cell.font = header_font
-                            cell.fill = header_fill
+                write_table(ws_rec, self._excel_record_rows(report_data['sections']['recommendations']))
 
             # 6. Cost Breakdown with Charts
             if 'cost_breakdown' in report_data['sections']:
                 cost_data = report_data['sections']['cost_breakdown']
                 if 'top_10_expensive' in cost_data:
                     ws_expensive = wb.create_sheet("Top 10 Expensive")
-                    df_expensive = pd.DataFrame(cost_data['top_10_expensive'])
-
-                    for r_idx, row in enumerate(dataframe_to_rows(df_expensive, index=False, header=True), 1):
-                        for c_idx, value in enumerate(row, 1):
-                            cell = ws_expensive.cell(row=r_idx, column=c_idx, value=value)
-                            if r_idx == 1:
-                                cell.font = header_font
-                                cell.fill = header_fill
+                    write_table(ws_expensive, self._excel_record_rows(cost_data['top_10_expensive']))
 
                     # Add bar chart
                     chart = BarChart()
@@ -526,12 +703,7 @@ class AdvancedReportGenerator:
 
             # 7. Full Portfolio
             ws_full = wb.create_sheet("Full Portfolio")
-            for r_idx, row in enumerate(dataframe_to_rows(self.df, index=False, header=True), 1):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws_full.cell(row=r_idx, column=c_idx, value=value)
-                    if r_idx == 1:
-                        cell.font = header_font
-                        cell.fill = header_fill
+            write_table(ws_full, self._excel_rows(self.df))
 
             wb.save(output)
             output.seek(0)
@@ -569,6 +741,142 @@ class AdvancedReportGenerator:
             output.seek(0)
             return output
 
+    @staticmethod
+    def _excel_rows(frame: pd.DataFrame, index: bool = False):
+        """Yield header and data rows of a frame laid out like openpyxl's dataframe_to_rows"""
+        yield ([None] if index else []) + frame.columns.tolist()
+        if index:
+            yield list(frame.index.names)
+
+        # Missing values become blank cells
+        cells = frame.astype(object).where(frame.notna(), None)
+        if index:
+            for label, row in zip(frame.index.tolist(), cells.itertuples(index=False, name=None)):
+                yield [label, *row]
+        else:
+            yield from cells.itertuples(index=False, name=None)
+
+    @staticmethod
+    def _excel_record_rows(records, index: bool = False):
+        """
+        Yield rows for a list of dicts, or a dict of dicts keyed by index label,
+        laid out like _excel_rows on the DataFrame built from them
+        """
+        columns = list(dict.fromkeys(key for record in (records.values() if index else records)
+                                     for key in record))
+        labelled = records.items() if index else ((None, record) for record in records)
+
+        yield ([None] if index else []) + columns
+        if index:
+            yield [None]
+        for label, record in labelled:
+            # Missing keys and values become blank cells
+            row = [None if pd.api.types.is_scalar(value) and pd.isna(value) else value
+                   for value in (record.get(column) for column in columns)]
+            yield [label, *row] if index else row
+
+    def _export_to_excel_streaming(self, report_data: Dict[str, Any]) -> BytesIO:
+        """
+        Export report to Excel with xlsxwriter in constant-memory mode.
+
+        Rows are flushed as they are written, so memory stays flat however
+        large the portfolio is. Sheets, cell positions and charts match the
+        openpyxl export.
+        """
+        output = BytesIO()
+        wb = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'default_date_format': 'yyyy-mm-dd h:mm:ss'
+        })
+        header_format = wb.add_format({'bold': True, 'font_size': 12, 'font_color': '#FFFFFF',
+                                       'bg_color': '#4472C4', 'pattern': 1})
+        bold_format = wb.add_format({'bold': True})
+
+        def write_table(ws, rows) -> None:
+            """Write rows with a styled header row"""
+            for row_number, row in enumerate(rows):
+                ws.write_row(row_number, 0, row, header_format if row_number == 0 else None)
+
+        def add_chart(ws, chart_type: str, title: str, name, values, categories,
+                      width: float, height: float, anchor: str, x_title: str = None, y_title: str = None):
+            """Chart of one series; sizes are in centimetres, as with openpyxl"""
+            chart = wb.add_chart({'type': chart_type})
+            chart.add_series({'name': name, 'values': values, 'categories': categories})
+            chart.set_title({'name': title})
+            if x_title:
+                chart.set_x_axis({'name': x_title})
+            if y_title:
+                chart.set_y_axis({'name': y_title})
+            chart.set_size({'width': round(width * 96 / 2.54), 'height': round(height * 96 / 2.54)})
+            ws.insert_chart(anchor, chart)
+
+        # 1. Summary Sheet with formatting
+        ws_summary = wb.add_worksheet("Summary")
+        summary = report_data['sections']['portfolio_overview']['summary']
+        ws_summary.merge_range('A1:B1', "Application Portfolio Summary",
+                               wb.add_format({'bold': True, 'font_size': 16}))
+        for row, (key, value) in enumerate(summary.items(), 2):
+            ws_summary.write(row, 0, key.replace('_', ' ').title(), bold_format)
+            ws_summary.write(row, 1, None if pd.isna(value) else value)
+
+        # 2. Category Breakdown with Bar Chart
+        if 'category_breakdown' in report_data['sections']['portfolio_overview']:
+            ws_cat = wb.add_worksheet("Category Breakdown")
+            category_breakdown = report_data['sections']['portfolio_overview']['category_breakdown']
+            write_table(ws_cat, self._excel_record_rows(category_breakdown, index=True))
+
+            last = len(category_breakdown)
+            add_chart(ws_cat, 'column', "Cost by Category",
+                      name=["Category Breakdown", 0, 2],
+                      values=["Category Breakdown", 1, 2, last, 2],
+                      categories=["Category Breakdown", 1, 0, last, 0],
+                      width=20, height=10, anchor="F2",
+                      x_title="Category", y_title="Annual Cost ($)")
+
+        # 3. Health Distribution with Pie Chart
+        ws_health = wb.add_worksheet("Health Distribution")
+        health_dist = report_data['sections']['portfolio_overview']['health_distribution']
+        ws_health.write_row(0, 0, ["Health Level", "Count"], header_format)
+        for row, (level, count) in enumerate(health_dist.items(), 1):
+            ws_health.write_row(row, 0, [level, count])
+
+        last = len(health_dist)
+        add_chart(ws_health, 'pie', "Application Health Distribution",
+                  name=["Health Distribution", 0, 1],
+                  values=["Health Distribution", 1, 1, last, 1],
+                  categories=["Health Distribution", 1, 0, last, 0],
+                  width=15, height=10, anchor="D2")
+
+        # 4. Top Risks
+        if 'top_risks' in report_data['sections']:
+            write_table(wb.add_worksheet("Top Risks"), self._excel_record_rows(report_data['sections']['top_risks']))
+
+        # 5. Recommendations
+        if 'recommendations' in report_data['sections']:
+            write_table(wb.add_worksheet("Recommendations"),
+                        self._excel_record_rows(report_data['sections']['recommendations']))
+
+        # 6. Cost Breakdown with Charts
+        if 'cost_breakdown' in report_data['sections']:
+            cost_data = report_data['sections']['cost_breakdown']
+            if 'top_10_expensive' in cost_data:
+                ws_expensive = wb.add_worksheet("Top 10 Expensive")
+                write_table(ws_expensive, self._excel_record_rows(cost_data['top_10_expensive']))
+                add_chart(ws_expensive, 'column', "Top 10 Most Expensive Applications",
+                          name=["Top 10 Expensive", 0, 1],
+                          values=["Top 10 Expensive", 1, 1, 10, 1],
+                          categories=["Top 10 Expensive", 1, 0, 10, 0],
+                          width=20, height=12, anchor="F2",
+                          x_title="Application", y_title="Annual Cost ($)")
+
+        # 7. Full Portfolio
+        write_table(wb.add_worksheet("Full Portfolio"), self._excel_rows(self.df))
+
+        wb.close()
+        output.seek(0)
+        return output
+
     def export_to_csv(self, report_data: Dict[str, Any]) -> str:
         """Export report summary to CSV format"""
 
@@ -1010,7 +1318,8 @@ class AdvancedReportGenerator:
             'json': True,
             'csv': True,
             'excel': True,
-            'excel_with_charts': OPENPYXL_CHARTS_AVAILABLE,
+            'excel_with_charts': XLSXWRITER_AVAILABLE or OPENPYXL_CHARTS_AVAILABLE,
+            'parquet': PYARROW_AVAILABLE,
             'pdf': REPORTLAB_AVAILABLE,
             'powerpoint': PPTX_AVAILABLE,
             'email': True
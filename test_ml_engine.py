@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+ML Engine Trend Prediction Test
+Checks that snapshots without a timestamp are ordered last, as the earlier
+DataFrame.sort_values implementation did.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.ml_engine import MLEngine
+
+
+def undated_history():
+    """Snapshots out of order, one with a None timestamp and one without the key"""
+    return [
+        {'assessment_timestamp': '2024-02-01', 'composite_score': 50.0},
+        {'assessment_timestamp': None, 'composite_score': 90.0},
+        {'assessment_timestamp': '2024-01-01', 'composite_score': 40.0},
+        {'composite_score': 70.0},
+    ]
+
+
+def dated_history():
+    """The same scores in the order undated_history() should be sorted into"""
+    return [
+        {'assessment_timestamp': f'2024-0{month}-01', 'composite_score': score}
+        for month, score in enumerate([40.0, 50.0, 90.0, 70.0], start=1)
+    ]
+
+
+def test_undated_snapshots_sort_last():
+    """predict_trends and predict_trends_batch put undated snapshots last"""
+    engine = MLEngine(model_path=tempfile.mkdtemp())
+    expected = engine.predict_trends(dated_history(), 'App')
+
+    assert engine.predict_trends(undated_history(), 'App') == expected
+    assert engine.predict_trends_batch({'App': undated_history()}) == [expected]
+
+
+if __name__ == '__main__':
+    test_undated_snapshots_sort_last()
+    print("✓ Undated snapshots are ordered last")
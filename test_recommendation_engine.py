@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Recommendation Engine Decision Matrix Test
+Checks that the vectorized decision matrix agrees with the per-application rules.
+"""
+
+import sys
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.recommendation_engine import RecommendationEngine
+
+
+class StrictRecommendationEngine(RecommendationEngine):
+    """Engine with every threshold overridden, to check they are not baked in."""
+
+    HIGH_SCORE = 80.0
+    MEDIUM_SCORE = 55.0
+    LOW_SCORE = 25.0
+    CRITICAL_BUSINESS_VALUE = 7.0
+    LOW_BUSINESS_VALUE = 4.0
+    VERY_POOR_TECH_HEALTH = 2.0
+    POOR_TECH_HEALTH = 5.0
+    FAIR_TECH_HEALTH = 6.5
+    GOOD_TECH_HEALTH = 8.0
+    POOR_SECURITY = 3.0
+
+
+def threshold_grid(engine):
+    """
+    Score columns covering both sides of every threshold the decision matrix
+    compares against, plus NaN.
+    """
+    nan = float('nan')
+    composite = [0, engine.LOW_SCORE - 0.1, engine.LOW_SCORE, engine.MEDIUM_SCORE - 0.1,
+                 engine.MEDIUM_SCORE, engine.HIGH_SCORE - 0.1, engine.HIGH_SCORE, 100, nan]
+    business_value = [0, engine.LOW_BUSINESS_VALUE, engine.LOW_BUSINESS_VALUE + 0.1,
+                      engine.CRITICAL_BUSINESS_VALUE - 0.1, engine.CRITICAL_BUSINESS_VALUE, 10, nan]
+    tech_health = [0, engine.VERY_POOR_TECH_HEALTH, engine.VERY_POOR_TECH_HEALTH + 0.1,
+                   engine.POOR_TECH_HEALTH, engine.POOR_TECH_HEALTH + 0.1,
+                   engine.FAIR_TECH_HEALTH - 0.1, engine.FAIR_TECH_HEALTH,
+                   engine.GOOD_TECH_HEALTH - 0.1, engine.GOOD_TECH_HEALTH, 10, nan]
+    security = [0, engine.POOR_SECURITY, engine.POOR_SECURITY + 0.1, 10, nan]
+    strategic_fit = [0, engine.CRITICAL_BUSINESS_VALUE - 0.1, engine.CRITICAL_BUSINESS_VALUE, 10, nan]
+    redundancy = [0, 1]
+
+    rows = np.array(list(product(
+        composite, business_value, tech_health, security, strategic_fit, redundancy
+    )))
+    return [rows[:, i] for i in range(rows.shape[1])]
+
+
+def check_engine(engine):
+    """Compare _classify_batch against _rule_for_scores for every grid row."""
+    composite, business_value, tech_health, security, strategic_fit, redundancy = threshold_grid(engine)
+
+    batch_rules = engine._classify_batch(
+        composite, business_value, tech_health, security, strategic_fit, redundancy == 1
+    )
+    row_rules = [
+        engine._rule_for_scores(*row)
+        for row in zip(composite.tolist(), business_value.tolist(), tech_health.tolist(),
+                       security.tolist(), strategic_fit.tolist(), redundancy.tolist())
+    ]
+
+    mismatches = np.flatnonzero(batch_rules != np.array(row_rules))
+    assert len(mismatches) == 0, (
+        f"{len(mismatches)} of {len(row_rules)} rows disagree, first at scores "
+        f"{[float(column[mismatches[0]]) for column in threshold_grid(engine)]}"
+    )
+
+
+def test_batch_matches_row_rules():
+    """Vectorized and per-application decision rules agree at every threshold edge."""
+    check_engine(RecommendationEngine())
+
+
+def test_batch_matches_row_rules_with_overridden_thresholds():
+    """Subclass thresholds are used by both decision paths."""
+    check_engine(StrictRecommendationEngine())
+
+
+if __name__ == '__main__':
+    test_batch_matches_row_rules()
+    test_batch_matches_row_rules_with_overridden_thresholds()
+    print("✓ Decision matrix paths agree")
@@ -1774,7 +1774,7 @@ def generate_report(report_type):
 
 @app.route('/api/reports/export/<string:report_type>/<string:format>', methods=['GET'])
 def export_report(report_type, format):
-    """Export report in specified format (json, excel, csv, pdf, powerpoint)"""
+    """Export report in specified format (json, excel, csv, parquet, pdf, powerpoint)"""
     global current_data
 
     try:
@@ -1809,6 +1809,13 @@ def export_report(report_type, format):
                 'Content-Disposition': f'attachment; filename={report_type}_report.csv'
             }
 
+        elif format == 'parquet':
+            parquet_output = generator.export_to_parquet(report_data)
+            return parquet_output.getvalue(), 200, {
+                'Content-Type': 'application/vnd.apache.parquet',
+                'Content-Disposition': f'attachment; filename={report_type}_report.parquet'
+            }
+
         elif format == 'pdf':
             pdf_output = generator.export_to_pdf(report_data)
             return pdf_output.getvalue(), 200, {